@@ -41,7 +41,11 @@ user interface:
     capabilities
     supports_operation
     supports_observable
+    supports_operations
+    supports_observables
     execute
+    batch_execute
+    session
     reset
 
 Abstract methods and attributes
@@ -64,6 +68,11 @@ The following methods and attributes must be defined for all devices:
 In addition, the following may also be optionally defined:
 
 .. autosummary::
+    batch_expval
+    measure_commuting
+    prepare_queue
+    deferrable_operations
+    apply_deferred
     pre_apply
     post_apply
     pre_measure
@@ -79,6 +88,7 @@ to ensure correct operation and internal consistency.
 
 .. autosummary::
     check_validity
+    compile_queue
 
 .. currentmodule:: pennylane._device
 
@@ -88,12 +98,110 @@ Code details
 """
 # pylint: disable=too-many-format-args
 import abc
-
-import autograd.numpy as np
+from collections import deque
+from contextlib import contextmanager
+import numbers
+from functools import lru_cache
+from itertools import groupby, starmap
+import sys
+from types import MappingProxyType
+
+import numpy as np
 from pennylane.operation import Operation, Observable, Sample, Variance, Expectation
 from .qnode import QuantumFunctionError
 
 
+#: frozenset[str]: single-wire observables that may share a wire with
+#: another observable of the same name in a qubit-wise commuting group
+_QWC_OBSERVABLES = frozenset({"PauliX", "PauliY", "PauliZ", "Hadamard"})
+
+
+class _NoOpContext: # pylint: disable=too-few-public-methods
+    """Context manager that does nothing, used in place of an execution context."""
+    def __enter__(self):
+        pass
+    def __exit__(self, type, value, traceback): # pylint: disable=redefined-builtin
+        pass
+
+
+#: _NoOpContext: default execution context, also used by :meth:`Device.execute` within a session
+_NO_CONTEXT = _NoOpContext()
+
+#: MappingProxyType: free parameter mapping used if none is passed to :meth:`Device.execute`
+_EMPTY_MAPPING = MappingProxyType({})
+
+
+def _store_result(results, idx, value):
+    """Store measured value(s) in the results buffer of :meth:`Device.execute`.
+
+    A preallocated array is upcast if the value cannot be stored in it,
+    for example if a device returns complex expectation values, and
+    replaced by a list if the value has a different shape than its entries.
+
+    Args:
+        results (array or list): results buffer
+        idx (int or slice): position of the value(s) in the buffer
+        value (Any): measured value(s)
+
+    Returns:
+        array or list: the results buffer, which is a new object if it was upcast or replaced
+    """
+    if isinstance(results, np.ndarray):
+        value = np.asarray(value)
+        if value.shape != np.shape(results[idx]):
+            results = list(results)
+        elif not np.can_cast(value.dtype, results.dtype, casting="same_kind"):
+            results = results.astype(np.result_type(results.dtype, value.dtype))
+
+    results[idx] = value
+    return results
+
+@lru_cache(maxsize=128)
+def _qubit_wise_commuting_groups(observables, wires):
+    """Partition observables into groups that qubit-wise commute.
+
+    Two observables qubit-wise commute if, on every wire they share, they
+    are the same single-wire observable from ``_QWC_OBSERVABLES``. The identity
+    commutes with all observables. Observables in the same group can
+    therefore be estimated from a single simultaneous measurement.
+
+    The partition is found greedily, by adding each observable to
+    the first compatible group.
+
+    Args:
+        observables (tuple[str]): names of the observables
+        wires (tuple[tuple[int]]): target subsystems of each observable
+
+    Returns:
+        tuple[tuple[int]]: indices of the observables in each group
+    """
+    groups = []
+    labels = []  # per group: dict mapping wire to the observable acting on it
+
+    for idx, (name, w) in enumerate(zip(observables, wires)):
+        if name == "Identity":
+            wire_labels = {}
+        elif name in _QWC_OBSERVABLES and len(w) == 1:
+            wire_labels = {w[0]: name}
+        else:
+            # never shares a wire with another observable
+            wire_labels = {wire: None for wire in w}
+
+        for group, group_labels in zip(groups, labels):
+            if all(
+                    wire not in group_labels or (label is not None and group_labels[wire] == label)
+                    for wire, label in wire_labels.items()
+            ):
+                group.append(idx)
+                group_labels.update(wire_labels)
+                break
+        else:
+            groups.append([idx])
+            labels.append(dict(wire_labels))
+
+    return tuple(tuple(group) for group in groups)
+
+
 class DeviceError(Exception):
     """Exception raised by a :class:`~.pennylane._device.Device` when it encounters an illegal
     operation in the quantum circuit.
@@ -114,14 +222,29 @@ class Device(abc.ABC):
     #pylint: disable=too-many-public-methods
     _capabilities = {} #: dict[str->*]: plugin capabilities
     _circuits = {}     #: dict[str->Circuit]: circuit templates associated with this API class
+    _validity_cache_size = 128 #: int: maximum number of validated circuit signatures to cache
+
+    deferrable_operations = frozenset()
+    """frozenset[str]: names of operations whose application may be deferred
+    and passed to :meth:`apply_deferred` in consecutive runs"""
 
     def __init__(self, wires=1, shots=0):
-        self.num_wires = wires
+        if not isinstance(wires, numbers.Integral):
+            raise DeviceError("The number of wires must be an integer, got {}.".format(wires))
+
+        # store as a plain Python integer, as plugins read it in inner loops
+        self.num_wires = int(wires)
         self.shots = shots
 
         self._op_queue = None
         self._obs_queue = None
         self._parameters = None
+        self._in_execution = False
+        self._in_session = False
+
+        self._operations_set = None
+        self._observables_set = None
+        self._valid_signatures = set()
 
     def __repr__(self):
         """String representation."""
@@ -185,7 +308,7 @@ class Device(abc.ABC):
         """
         return cls._capabilities
 
-    def execute(self, queue, observables, parameters={}):
+    def execute(self, queue, observables, parameters=None):
         """Execute a queue of quantum operations on the device and then measure the given observables.
 
         For plugin developers: Instead of overwriting this, consider implementing a suitable subset of
@@ -198,7 +321,8 @@ class Device(abc.ABC):
             parameters (dict[int->list[(int, int)]]): Mapping from free parameter index to the list of
                 :class:`Operations <pennylane.operation.Operation>` (in the queue) that depend on it.
                 The first element of the tuple is the index of the Operation in the program queue,
-                the second the index of the parameter within the Operation.
+                the second the index of the parameter within the Operation. If not provided,
+                an empty mapping is used.
 
         Returns:
             array[float]: measured value(s)
@@ -206,47 +330,243 @@ class Device(abc.ABC):
         self.check_validity(queue, observables)
         self._op_queue = queue
         self._obs_queue = observables
-        self._parameters = {}
-        self._parameters.update(parameters)
+        # read-only view of the mapping, created once per execution
+        self._parameters = _EMPTY_MAPPING if parameters is None else MappingProxyType(parameters)
+        self._in_execution = True
+
+        return_types = [obs.return_type for obs in observables]
+        num_results = len(return_types) - return_types.count(None)
+        sampled = Sample in return_types
+
+        if sampled:
+            sample_sizes = {getattr(obs, "num_samples", None) for obs in observables}
+
+            if return_types.count(Sample) == len(return_types) and len(sample_sizes) == 1 \
+                    and None not in sample_sizes:
+                # all observables are sampled the same number of times, so the
+                # samples can be written directly into a single array, which is
+                # allocated by _measure from the shape and type of the first sample
+                results = None
+            else:
+                results = [None] * num_results
+        else:
+            # without samples, every result is a scalar and can be
+            # written directly into a preallocated array, which is
+            # upcast if the device returns values that are not real
+            results = np.empty(num_results, dtype=np.float64)
+
+        # within a session, the execution context is already active
+        context = _NO_CONTEXT if self._in_session else self.execution_context()
+
+        with context:
+            schedule = self.prepare_queue(self.compile_queue(queue))
 
-        results = []
-
-        with self.execution_context():
             self.pre_apply()
 
-            for operation in queue:
-                self.apply(operation.name, operation.wires, operation.parameters)
+            self._apply_schedule(schedule)
 
             self.post_apply()
 
             self.pre_measure()
 
-            for obs in observables:
-                if obs.return_type is Expectation:
-                    results.append(self.expval(obs.name, obs.wires, obs.parameters))
-                elif obs.return_type is Variance:
-                    results.append(self.var(obs.name, obs.wires, obs.parameters))
-                elif obs.return_type is Sample:
-                    if not hasattr(obs, "num_samples"):
-                        raise DeviceError("Number of samples not specified for observable {}".format(obs.name))
-                    results.append(np.array(self.sample(obs.name, obs.wires, obs.parameters, obs.num_samples)))
-                elif obs.return_type is not None:
-                    raise QuantumFunctionError("Unsupported return type specified for observable {}".format(obs.name))
+            if return_types.count(Expectation) == len(return_types):
+                # specialized path for the most common case, where only
+                # expectation values are returned
+                results = _store_result(results, slice(None), self.batch_expval(
+                    [obs.name for obs in observables],
+                    [obs.wires for obs in observables],
+                    [obs.parameters for obs in observables]
+                ))
+            else:
+                results = self._measure(observables, results)
 
             self.post_measure()
 
+            self._in_execution = False
             self._op_queue = None
             self._obs_queue = None
             self._parameters = None
 
+            if isinstance(results, np.ndarray):
+                return results
+
             # Ensures that a combination with sample does not put
             # expvals and vars in superfluous arrays
-            if all(obs.return_type is Sample for obs in observables):
+            if all(return_type is Sample for return_type in return_types):
                 return np.asarray(results)
-            if any(obs.return_type is Sample for obs in observables):
-                return np.asarray(results, dtype="object")
 
-            return np.asarray(results)
+            return np.asarray(results, dtype="object")
+
+    def _measure(self, observables, results):
+        """Measure observables with arbitrary return types.
+
+        Contiguous runs of expectation values are measured with a single call
+        to :meth:`batch_expval`, so that plugins can share work between them.
+
+        Args:
+            observables (Iterable[~.operation.Observable]): observables to measure
+            results (array or list or None): buffer the measured values are written to, with
+                one entry per observable with a return type; if ``None``, all observables
+                must be sampled and the buffer is allocated from the first sample
+
+        Returns:
+            array or list: the results buffer, which is a new object if it had to be
+            allocated, upcast or replaced
+        """
+        idx = 0
+
+        for return_type, group in groupby(observables, key=lambda obs: obs.return_type):
+            if return_type is Expectation:
+                group = list(group)
+                results = _store_result(results, slice(idx, idx + len(group)), self.batch_expval(
+                    [obs.name for obs in group],
+                    [obs.wires for obs in group],
+                    [obs.parameters for obs in group]
+                ))
+                idx += len(group)
+                continue
+
+            for obs in group:
+                if obs.return_type is Variance:
+                    results = _store_result(results, idx, self.var(obs.name, obs.wires, obs.parameters))
+                elif obs.return_type is Sample:
+                    num_samples = getattr(obs, "num_samples", None)
+                    if num_samples is None:
+                        raise DeviceError("Number of samples not specified for observable {}".format(obs.name))
+                    sample = np.asarray(self.sample(obs.name, obs.wires, obs.parameters, num_samples))
+                    if results is None:
+                        results = np.empty((len(observables),) + sample.shape, dtype=sample.dtype)
+                    results = _store_result(results, idx, sample)
+                elif obs.return_type is not None:
+                    raise QuantumFunctionError("Unsupported return type specified for observable {}".format(obs.name))
+                else:
+                    continue
+
+                idx += 1
+
+        return results
+
+    def batch_execute(self, queues, observables, parameters=None):
+        """Execute several circuits on the device, for example to sweep over parameter values.
+
+        Each circuit is executed with :meth:`execute`. Circuits sharing the same structure
+        are only validated once (see :meth:`check_validity`).
+
+        For plugin developers: overwrite this method if the device supports
+        submitting several circuits to the backend at once.
+
+        Args:
+            queues (Sequence[Iterable[~.operation.Operation]]): the operation queue of each circuit
+            observables (Sequence[Iterable[~.operation.Observable]]): the observables to measure
+                and return for each circuit
+            parameters (Sequence[dict[int->list[(int, int)]]]): the free parameter mapping of each
+                circuit (see :meth:`execute`). If not provided, an empty mapping is used for all circuits.
+
+        Returns:
+            list[array[float]]: measured value(s) of each circuit
+        """
+        if parameters is None:
+            parameters = [None] * len(queues)
+
+        if not len(queues) == len(observables) == len(parameters):
+            raise ValueError("The number of queues, observable lists and parameter mappings must match.")
+
+        with self.session():
+            return [self.execute(q, o, p) for q, o, p in zip(queues, observables, parameters)]
+
+    @contextmanager
+    def session(self):
+        """Context manager that keeps the device execution context active across several executions.
+
+        Within the session, :meth:`execute` does not enter and exit the context returned by
+        :meth:`execution_context` on every call, amortizing its setup cost:
+
+        .. code-block:: python
+
+            with dev.session():
+                for queue, observables in circuits:
+                    dev.execute(queue, observables)
+
+        Nested sessions reuse the outermost execution context.
+
+        Yields:
+            Device: the device itself
+        """
+        if self._in_session:
+            yield self
+            return
+
+        with self.execution_context():
+            self._in_session = True
+            try:
+                yield self
+            finally:
+                self._in_session = False
+
+    def _apply_schedule(self, schedule):
+        """Apply a compiled operation schedule to the device.
+
+        Operations listed in :attr:`deferrable_operations` are not applied
+        immediately; consecutive runs of them are collected and passed to
+        :meth:`apply_deferred` before the next non-deferrable operation,
+        or once the end of the schedule is reached.
+
+        Args:
+            schedule (list[tuple[str, list[int], list]]): schedule returned by :meth:`compile_queue`
+        """
+        apply = self.apply
+        deferrable = self.deferrable_operations
+
+        if not deferrable:
+            # consume the schedule with C-level iteration, avoiding
+            # the bytecode overhead of a Python for loop per operation
+            deque(starmap(apply, schedule), maxlen=0)
+            return
+
+        deferred = []
+        for name, wires, par in schedule:
+            if name in deferrable:
+                deferred.append((name, wires, par))
+                continue
+
+            if deferred:
+                self.apply_deferred(deferred)
+                deferred = []
+
+            apply(name, wires, par)
+
+        if deferred:
+            self.apply_deferred(deferred)
+
+    @staticmethod
+    def compile_queue(queue):
+        """Resolve the operation queue into a schedule of device instructions.
+
+        The name, wires and parameter values of each operation are looked up once,
+        so that :meth:`execute` only needs to dispatch the resulting instructions
+        to :meth:`apply`. Since parameter values depend on the current values of
+        the free variables, the schedule must be recompiled on each execution.
+
+        Args:
+            queue (Iterable[~.operation.Operation]): operations to execute on the device
+
+        Returns:
+            list[tuple[str, list[int], list]]: the name, wires and parameter values
+            of each operation in the queue
+        """
+        return [(op.name, op.wires, op.parameters) for op in queue]
+
+    @staticmethod
+    def _raise_outside_execution(item):
+        """Raise an error for an attribute accessed outside of the execution context.
+
+        Args:
+            item (str): description of the accessed attribute
+
+        Raises:
+            ValueError: always
+        """
+        raise ValueError("Cannot access the {} outside of the execution context!".format(item))
 
     @property
     def op_queue(self):
@@ -258,8 +578,8 @@ class Device(abc.ABC):
         Returns:
             list[~.operation.Operation]
         """
-        if self._op_queue is None:
-            raise ValueError("Cannot access the operation queue outside of the execution context!")
+        if not self._in_execution:
+            self._raise_outside_execution("operation queue")
 
         return self._op_queue
 
@@ -273,8 +593,8 @@ class Device(abc.ABC):
         Returns:
             list[~.operation.Observable]
         """
-        if self._obs_queue is None:
-            raise ValueError("Cannot access the observable value queue outside of the execution context!")
+        if not self._in_execution:
+            self._raise_outside_execution("observable value queue")
 
         return self._obs_queue
 
@@ -286,16 +606,58 @@ class Device(abc.ABC):
         Note that this property can only be accessed within the execution context
         of :meth:`~.execute`.
 
+        The mapping is a read-only view of the mapping passed to :meth:`~.execute`,
+        and cannot be modified by the device.
+
         Returns:
-            dict[int->list[(int, int)]]: the first element of the tuple is the index
+            Mapping[int->list[(int, int)]]: the first element of the tuple is the index
             of the Operation in the program queue, the second the index of the parameter
             within the Operation.
         """
-        if self._parameters is None:
-            raise ValueError("Cannot access the free parameter mapping outside of the execution context!")
+        if not self._in_execution:
+            self._raise_outside_execution("free parameter mapping")
 
         return self._parameters
 
+    def prepare_queue(self, schedule):
+        """Prepare the compiled operation schedule before it is applied.
+
+        Called during :meth:`execute` with the schedule returned by :meth:`compile_queue`,
+        before :meth:`pre_apply`. The default implementation returns the schedule unchanged.
+
+        For plugin developers: overwrite this method to reorder commuting
+        operations or fuse several operations into one, reducing the number
+        of operations the device has to apply.
+
+        Args:
+            schedule (list[tuple[str, list[int], list]]): the name, wires and
+                parameter values of each operation in the queue
+
+        Returns:
+            list[tuple[str, list[int], list]]: the schedule to apply
+        """
+        # pylint: disable=no-self-use
+        return schedule
+
+    def apply_deferred(self, operations):
+        """Apply a run of consecutive deferred operations.
+
+        Called during :meth:`execute` with operations whose names are listed in
+        :attr:`deferrable_operations`, before the next non-deferrable operation
+        is applied and before :meth:`post_apply`. The default implementation
+        calls :meth:`apply` for each operation in turn.
+
+        For plugin developers: overwrite this method to apply the deferred
+        operations in a single pass, for example by combining a sequence
+        of Clifford gates into a single permutation and phase.
+
+        Args:
+            operations (list[tuple[str, list[int], list]]): the name, wires and
+                parameter values of each deferred operation
+        """
+        for name, wires, par in operations:
+            self.apply(name, wires, par)
+
     def pre_apply(self):
         """Called during :meth:`execute` before the individual operations are executed."""
         pass
@@ -322,14 +684,39 @@ class Device(abc.ABC):
         source of :meth:`.Device.execute` for more details).
         """
         # pylint: disable=no-self-use
-        class MockContext: # pylint: disable=too-few-public-methods
-            """Mock class as a default for the with statement in execute()."""
-            def __enter__(self):
-                pass
-            def __exit__(self, type, value, traceback):
-                pass
+        return _NO_CONTEXT
+
+    def _supported_operations(self):
+        """Frozen set of the operation names supported by the device.
 
-        return MockContext()
+        The :attr:`operations` property is only evaluated on first use; the
+        resulting set is cached on the instance, so that repeated membership
+        checks do not rebuild the set of supported operations. The names are
+        interned, so that they match operation names by identity.
+
+        Returns:
+            frozenset[str]: the supported operation names
+        """
+        if self._operations_set is None:
+            self._operations_set = frozenset(map(sys.intern, self.operations))
+
+        return self._operations_set
+
+    def _supported_observables(self):
+        """Frozen set of the observable names supported by the device.
+
+        The :attr:`observables` property is only evaluated on first use; the
+        resulting set is cached on the instance, so that repeated membership
+        checks do not rebuild the set of supported observables. The names are
+        interned, so that they match observable names by identity.
+
+        Returns:
+            frozenset[str]: the supported observable names
+        """
+        if self._observables_set is None:
+            self._observables_set = frozenset(map(sys.intern, self.observables))
+
+        return self._observables_set
 
     def supports_operation(self, operation):
         """Checks if an operation is supported by this device.
@@ -340,10 +727,10 @@ class Device(abc.ABC):
         Returns:
             bool: ``True`` iff supplied operation is supported
         """
-        if isinstance(operation, type) and issubclass(operation, Operation):
-            return operation.__name__ in self.operations
         if isinstance(operation, str):
-            return operation in self.operations
+            return operation in self._supported_operations()
+        if isinstance(operation, type) and issubclass(operation, Operation):
+            return operation.__name__ in self._supported_operations()
 
         raise ValueError("The given operation must either be a pennylane.Operation class or a string.")
 
@@ -356,30 +743,72 @@ class Device(abc.ABC):
         Returns:
             bool: ``True`` iff supplied observable is supported
         """
-        if isinstance(observable, type) and issubclass(observable, Observable):
-            return observable.__name__ in self.observables
         if isinstance(observable, str):
-            return observable in self.observables
+            return observable in self._supported_observables()
+        if isinstance(observable, type) and issubclass(observable, Observable):
+            return observable.__name__ in self._supported_observables()
 
         raise ValueError("The given operation must either be a pennylane.Observable class or a string.")
 
+    def supports_operations(self, operations):
+        """Checks which of several operations are supported by this device.
+
+        Args:
+            operations (Sequence[Operation,str]): operations to be checked
+
+        Returns:
+            array[bool]: mask that is ``True`` for each supported operation
+        """
+        return np.fromiter(
+            (self.supports_operation(o) for o in operations), dtype=bool, count=len(operations)
+        )
+
+    def supports_observables(self, observables):
+        """Checks which of several observables are supported by this device.
+
+        Args:
+            observables (Sequence[Observable,str]): observables to be checked
+
+        Returns:
+            array[bool]: mask that is ``True`` for each supported observable
+        """
+        return np.fromiter(
+            (self.supports_observable(o) for o in observables), dtype=bool, count=len(observables)
+        )
 
     def check_validity(self, queue, observables):
         """Checks whether the operations and observables in queue are all supported by the device.
 
+        Successfully validated combinations of operation and observable names are
+        cached, so that repeated executions of the same circuit structure are only
+        validated once.
+
         Args:
             queue (Iterable[~.operation.Operation]): quantum operation objects which are intended
                 to be applied on the device
             expectations (Iterable[~.operation.Observable]): observables which are intended
                 to be evaluated on the device
         """
-        for o in queue:
-            if o.name not in self.operations:
-                raise DeviceError("Gate {} not supported on device {}".format(o.name, self.short_name))
+        signature = (tuple(o.name for o in queue), tuple(o.name for o in observables))
 
-        for o in observables:
-            if o.name not in self.observables:
-                raise DeviceError("Observable {} not supported on device {}".format(o.name, self.short_name))
+        if signature in self._valid_signatures:
+            # this combination of operations and observables has already been validated
+            return
+
+        supported_operations = self._supported_operations()
+        for name in signature[0]:
+            if name not in supported_operations:
+                raise DeviceError("Gate {} not supported on device {}".format(name, self.short_name))
+
+        supported_observables = self._supported_observables()
+        for name in signature[1]:
+            if name not in supported_observables:
+                raise DeviceError("Observable {} not supported on device {}".format(name, self.short_name))
+
+        if len(self._valid_signatures) >= self._validity_cache_size:
+            self._valid_signatures.clear()
+
+        self._valid_signatures.add(signature)
 
     @abc.abstractmethod
     def apply(self, operation, wires, par):
@@ -408,6 +837,70 @@ class Device(abc.ABC):
             """
         raise NotImplementedError
 
+    def batch_expval(self, observables, wires, par):
+        r"""Returns the expectation values of several observables.
+
+        Called by :meth:`execute` for every contiguous run of observables with
+        return type :attr:`~.Expectation`. If the device overwrites
+        :meth:`measure_commuting`, the default implementation partitions the
+        observables into qubit-wise commuting groups, and passes each group to it.
+        Otherwise, :meth:`expval` is called for each observable in order.
+
+        For plugin developers: overwrite this method if the device can compute
+        several expectation values at once, for example by reusing the final
+        quantum state for all of them.
+
+        Args:
+          observables (list[str]): names of the observables
+          wires (list[Sequence[int]]): target subsystems of each observable
+          par (list[tuple[float]]): parameter values of each observable
+
+        Returns:
+          list[float]: expectation values, in the same order as ``observables``
+        """
+        if len(observables) == 1 or \
+                getattr(self.measure_commuting, "__func__", None) is Device.measure_commuting:
+            # grouping only pays off if the device measures the groups simultaneously,
+            # otherwise the observables are measured in order, so that the results
+            # for a given random seed do not depend on the grouping
+            return [self.expval(o, w, p) for o, w, p in zip(observables, wires, par)]
+
+        groups = _qubit_wise_commuting_groups(tuple(observables), tuple(tuple(w) for w in wires))
+
+        results = [None] * len(observables)
+        for group in groups:
+            group_results = self.measure_commuting(
+                [observables[i] for i in group],
+                [wires[i] for i in group],
+                [par[i] for i in group]
+            )
+
+            for i, res in zip(group, group_results):
+                results[i] = res
+
+        return results
+
+    def measure_commuting(self, observables, wires, par):
+        r"""Returns the expectation values of a group of qubit-wise commuting observables.
+
+        Called by :meth:`batch_expval`. Since the observables qubit-wise commute,
+        their expectation values can be estimated from a single simultaneous
+        measurement. The default implementation calls :meth:`expval` for
+        each observable in turn.
+
+        For plugin developers: overwrite this method to estimate all
+        expectation values of the group from the same set of measurement samples.
+
+        Args:
+          observables (list[str]): names of the observables
+          wires (list[Sequence[int]]): target subsystems of each observable
+          par (list[tuple[float]]): parameter values of each observable
+
+        Returns:
+          list[float]: expectation values, in the same order as ``observables``
+        """
+        return [self.expval(o, w, p) for o, w, p in zip(observables, wires, par)]
+
     def var(self, observable, wires, par):
         r"""Returns the variance of observable on specified wires.
 
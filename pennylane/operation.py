@@ -112,6 +112,7 @@ Code details
 import abc
 from enum import Enum, IntEnum
 import numbers
+import sys
 from collections.abc import Sequence
 
 import autograd.numpy as np
@@ -297,7 +298,7 @@ class Operation(abc.ABC):
 
     def __init__(self, *args, wires=None, do_queue=True):
         # pylint: disable=too-many-branches
-        self.name = self.__class__.__name__   #: str: name of the operation
+        self.name = sys.intern(self.__class__.__name__)   #: str: name of the operation
 
         if self.num_wires == All:
             if do_queue:
@@ -341,10 +342,17 @@ class Operation(abc.ABC):
         else:
             self._wires = wires
 
+        #: list[int] or None: wire values, if none of the wires are free
+        self._fixed_wires = None
+
         if all([isinstance(w, int) for w in self._wires]):
             # If all wires are integers (i.e., not Variable), check
             # that they are valid for the given operation
             self.check_wires(self._wires)
+            # the wires do not change between circuit evaluations,
+            # so their values only need to be resolved once; the
+            # conversion turns bools into plain integers, as in wires
+            self._fixed_wires = [int(w) for w in self._wires]
 
         if do_queue:
             self.queue()
@@ -421,6 +429,9 @@ class Operation(abc.ABC):
         Returns:
             list[int]: wire values
         """
+        if self._fixed_wires is not None:
+            return list(self._fixed_wires)
+
         w = [i.val if isinstance(i, Variable) else i for i in self._wires]
         self.check_wires(w)
         return [int(i) for i in w]
@@ -295,12 +295,15 @@ class DefaultQubit(Device):
         wires (int): the number of modes to initialize the device in
         shots (int): How many times the circuit should be evaluated (or sampled) to estimate
             the expectation values. A value of 0 yields the exact result.
+        supports_fusion (bool): whether consecutive single-qubit gates acting on the
+            same wire are fused into a single unitary before being applied
     """
     name = 'Default qubit PennyLane plugin'
     short_name = 'default.qubit'
     pennylane_requires = '0.5'
     version = '0.4.0'
     author = 'Xanadu Inc.'
+    _capabilities = {'supports_fusion': True}
 
     # Note: BasisState and QubitStateVector don't
     # map to any particular function, as they modify
@@ -336,14 +339,68 @@ class DefaultQubit(Device):
         'Identity': identity
     }
 
-    def __init__(self, wires, *, shots=0):
+    def __init__(self, wires, *, shots=0, supports_fusion=True):
         super().__init__(wires, shots)
+        # per-instance copy, so that fusion can be switched off for a single device
+        self._capabilities = dict(self._capabilities, supports_fusion=supports_fusion)
         self.eng = None
         self._state = None
 
     def pre_apply(self):
         self.reset()
 
+    def prepare_queue(self, schedule):
+        """Fuse consecutive single-qubit gates acting on the same wire.
+
+        Single-qubit gates are collected per wire, and applied as a single
+        ``QubitUnitary`` once an operation acting on more than one wire
+        touches that wire, or at the end of the schedule. Since the fused
+        gates act on disjoint wires, this only reorders commuting operations.
+        Wires with a single pending gate apply it unchanged.
+
+        Fusion is switched off by creating the device with ``supports_fusion=False``.
+
+        Args:
+            schedule (list[tuple[str, list[int], list]]): the name, wires and
+                parameter values of each operation in the queue
+
+        Returns:
+            list[tuple[str, list[int], list]]: the fused schedule
+        """
+        if not self._capabilities['supports_fusion']:
+            return schedule
+
+        fused = []
+        pending = {}  # wire -> list of pending single-qubit operations
+
+        def flush(wires):
+            for w in wires:
+                if w not in pending:
+                    continue
+
+                ops = pending.pop(w)
+                if len(ops) == 1:
+                    fused.append(ops[0])
+                    continue
+
+                U = np.identity(2)
+                for name, _, par in ops:
+                    U = self._get_operator_matrix(name, par) @ U
+                fused.append(('QubitUnitary', [w], [U]))
+
+        for name, wires, par in schedule:
+            if len(wires) == 1 and self._operation_map.get(name) is not None \
+                    and (name != 'QubitUnitary' or np.shape(par[0]) == (2, 2)):
+                pending.setdefault(wires[0], []).append((name, wires, par))
+                continue
+
+            # state preparations may be applied with no wires specified
+            flush(list(pending) if not wires else wires)
+            fused.append((name, wires, par))
+
+        flush(list(pending))
+        return fused
+
     def apply(self, operation, wires, par):
         if operation == 'QubitStateVector':
             state = np.asarray(par[0], dtype=np.complex128)
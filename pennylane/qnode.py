@@ -102,7 +102,10 @@ Auxiliary functions
 
 .. autosummary::
    _inv_dict
+   _float_output
+   _transformed_derivative
    _get_default_args
+   _structure_key
 
 
 QNode methods
@@ -124,7 +127,11 @@ QNode internal methods
    _best_method
    _append_op
    _op_successors
-   _pd_finite_diff
+   _observable_light_cone
+   _check_wires
+   _use_cached_structure
+   _result_key
+   _pd_finite_diff_batch
    _pd_analytic
 
 .. currentmodule:: pennylane.qnode
@@ -132,10 +139,9 @@ QNode internal methods
 Code details
 ~~~~~~~~~~~~
 """
+from collections import OrderedDict, defaultdict
 from collections.abc import Sequence
 import inspect
-import copy
-
 import numbers
 
 import autograd.numpy as np
@@ -148,6 +154,10 @@ from pennylane.utils import _flatten, unflatten
 from .variable import Variable
 
 
+#: tuple[str]: keyword arguments of QNode.jacobian that are not passed to the quantum function
+_JACOBIAN_KWARGS = ('h', 'order', 'shots', 'force_order2')
+
+
 def pop_jacobian_kwargs(kwargs):
     """Remove QNode.jacobian specific keyword arguments from a dictionary.
 
@@ -159,15 +169,19 @@ def pop_jacobian_kwargs(kwargs):
 
     Returns:
         dict: keyword arguments with all QNode.jacobian
-        keyword arguments removed
+        keyword arguments removed. If there are none,
+        the input dictionary itself is returned.
     """
     # TODO: refactor QNode.jacobian to pass all gradient
     # specific options under a single `gradient_options`
     # dictionary, allowing this function to be removed.
+    if not any(k in kwargs for k in _JACOBIAN_KWARGS):
+        return kwargs
+
     circuit_kwargs = {}
     circuit_kwargs.update(kwargs)
 
-    for k in ('h', 'order', 'shots', 'force_order2'):
+    for k in _JACOBIAN_KWARGS:
         circuit_kwargs.pop(k, None)
 
     return circuit_kwargs
@@ -189,10 +203,46 @@ def _inv_dict(d):
     Returns:
         dict[b->set[a]]: reversed mapping
     """
-    ret = {}
+    ret = defaultdict(set)
     for k, v in d.items():
-        ret.setdefault(v, set()).add(k)
-    return ret
+        ret[v].add(k)
+    return dict(ret)
+
+
+def _float_output(ret):
+    """Convert the output of a device measuring a single expectation value or variance to a float.
+
+    Args:
+        ret (array[float] or float): single-element array returned by the device
+
+    Returns:
+        float: measured value
+    """
+    if isinstance(ret, np.ndarray):
+        # NumPy deprecates float() of arrays with ndim > 0, so the element is
+        # extracted first; float() still rejects complex values as before
+        return float(ret.item())
+    return float(ret)
+
+
+def _transformed_derivative(Z2, Z1, Z0, B, B_inv, multiplier):
+    """Heisenberg picture derivative of a Gaussian operation, conjugated by its successors.
+
+    Used by the order-2 analytic method. The scalar multiplier is applied last,
+    so that only a single matrix is scaled.
+
+    Args:
+        Z2 (array[float]): transformation of the operation with a positive parameter shift
+        Z1 (array[float]): transformation of the operation with a negative parameter shift
+        Z0 (array[float]): inverse transformation of the unshifted operation
+        B (array[float]): product of the transformations of the successor operations
+        B_inv (array[float]): product of the inverse transformations of the successor operations
+        multiplier (float): parameter-shift rule multiplier
+
+    Returns:
+        array[float]: transformation matrix
+    """
+    return np.linalg.multi_dot([B, Z2-Z1, Z0, B_inv]) * multiplier
 
 
 def _get_default_args(func):
@@ -213,6 +263,37 @@ def _get_default_args(func):
     }
 
 
+def _structure_key(args, kwargs):
+    """Structural key of the arguments passed to a quantum function.
+
+    The key only depends on the nested structure of the positional arguments,
+    and on the names and flattened sizes of the keyword arguments, but
+    not on their numerical values.
+
+    Args:
+        args (tuple): positional arguments
+        kwargs (dict): keyword arguments
+
+    Returns:
+        tuple: hashable structural key
+    """
+    def shape(x):
+        "Returns a hashable description of the nested structure of x."
+        if isinstance(x, np.ndarray):
+            return x.shape
+        if isinstance(x, Sequence) and not isinstance(x, str):
+            return tuple(shape(item) for item in x)
+        return None
+
+    return shape(args), tuple(sorted((k, len(list(_flatten(v)))) for k, v in kwargs.items()))
+
+
+#: tuple[str]: QNode attributes that describe the constructed circuit, see :meth:`QNode.construct`
+_STRUCTURE_ATTRS = ('queue', 'ev', 'ops', 'model', 'num_variables',
+                    'output_conversion', 'output_dim', 'type',
+                    'variable_ops', 'grad_method_for_par', '_op_kinds', '_free_wires', '_light_cone', '_shift_table')
+
+
 class QNode:
     """Quantum node in the hybrid computational graph.
 
@@ -223,12 +304,29 @@ class QNode:
         cache (bool): If ``True``, the quantum function used to generate the QNode will
             only be called to construct the quantum circuit once, on first execution,
             and this circuit structure (i.e., the placement of templates, gates, measurements, etc.) will be cached for all further executions. The circuit parameters can still change with every call. Only activate this
-            feature if your quantum circuit structure will never change.
+            feature if your quantum circuit structure will never change. If the QNode is called with arguments of
+            differing shapes, a separate circuit is constructed and cached for each argument structure.
+        result_cache_size (int): In caching mode, the number of most recent evaluation results to store,
+            keyed by the argument values. Evaluating the QNode again with the same arguments then returns
+            the stored result without executing the circuit on the device. Only use this with devices
+            that return deterministic results. Circuits returning samples are never stored.
+            The default value 0 disables result caching.
     """
     # pylint: disable=too-many-instance-attributes
+    # slots speed up the attribute access in evaluate and jacobian;
+    # __dict__ is kept so that further attributes can still be set on instances
+    __slots__ = ('func', 'device', 'num_wires', 'num_variables', 'cache', 'queue', 'ev', 'ops',
+                 'model', 'variable_ops', 'grad_method_for_par', 'output_conversion', 'output_dim',
+                 'type', 'keyword_defaults', 'keyword_positions', 'result_cache_size',
+                 '_flat_keyword_defaults', '_construct_cache', '_structure', '_structure_locked',
+                 '_result_cache', '_op_kinds', '_free_wires', '_wires_checked', '_heisenberg_cache',
+                 '_heisenberg_obs', '_var_expvals', '_squared_observables', '_light_cone', '_shift_table',
+                 '_temp_var', '__dict__')
+
     _current_context = None  #: QNode: for building Operation sequences by executing quantum circuit functions
+    _construct_cache_size = 16  #: int: maximum number of circuit structures cached in caching mode
 
-    def __init__(self, func, device, cache=False):
+    def __init__(self, func, device, cache=False, result_cache_size=0):
         self.func = func
         self.device = device
         self.num_wires = device.num_wires
@@ -237,6 +335,33 @@ class QNode:
 
         self.cache = cache
 
+        # the signature of func does not change, so inspect its default arguments only once
+        keyword_sig = _get_default_args(func)
+        self.keyword_defaults = {k: v[1] for k, v in keyword_sig.items()}  #: dict[str->Any]: default keyword argument values
+        self.keyword_positions = {v[0]: k for k, v in keyword_sig.items()}  #: dict[int->str]: positions of keyword arguments
+
+        #: dict[str->array]: flattened default keyword argument values, as stored in :attr:`Variable.kwarg_values`
+        self._flat_keyword_defaults = {k: np.array(list(_flatten(v))) for k, v in self.keyword_defaults.items()}
+
+        #: OrderedDict[tuple->tuple]: circuits constructed in caching mode, keyed by argument structure
+        self._construct_cache = OrderedDict()
+        self._structure = None  #: tuple: structural key of the currently constructed circuit
+        self._structure_locked = False  #: bool: if True, the circuit structure may not be changed
+        #: dict[int->tuple]: Heisenberg transformations of operation successors, cached within :meth:`jacobian`
+        self._heisenberg_cache = {}
+        #: dict[tuple->tuple]: Heisenberg representations of the measured observables, cached within :meth:`jacobian`
+        self._heisenberg_obs = {}
+        #: array[float]: expectation values of the measured observables, cached within :meth:`jacobian`
+        self._var_expvals = None
+        #: dict[int->Observable]: squared variance observables, cached within :meth:`jacobian`
+        self._squared_observables = {}
+        #: Variable: temporary parameter replacing the differentiated one in :meth:`_pd_analytic`
+        self._temp_var = Variable()
+
+        self.result_cache_size = result_cache_size
+        #: OrderedDict[tuple->array]: most recent evaluation results in caching mode, keyed by argument values
+        self._result_cache = OrderedDict()
+
         self.variable_ops = {}
         """ dict[int->list[(int, int)]]: Mapping from free parameter index to the list of
         :class:`Operations <pennylane.operation.Operation>` (in this circuit) that depend on it.
@@ -298,7 +423,8 @@ class QNode:
             kwargs = {}
 
         # flatten the args, replace each with a Variable instance with a unique index
-        temp = [Variable(idx) for idx, val in enumerate(_flatten(args))]
+        flat_args = list(_flatten(args))
+        temp = [Variable(idx) for idx, _ in enumerate(flat_args)]
         self.num_variables = len(temp)
 
         # store the nested shape of the arguments for later unflattening
@@ -307,11 +433,7 @@ class QNode:
         # arrange the newly created Variables in the nested structure of args
         variables = unflatten(temp, args)
 
-        # get default kwargs that weren't passed
-        keyword_sig = _get_default_args(self.func)
-        self.keyword_defaults = {k: v[1] for k, v in keyword_sig.items()}
-        self.keyword_positions = {v[0]: k for k, v in keyword_sig.items()}
-
+        # use default kwargs for those that weren't passed
         keyword_values = {}
         keyword_values.update(self.keyword_defaults)
         keyword_values.update(kwargs)
@@ -324,7 +446,7 @@ class QNode:
                 temp = [Variable(idx, name=key) for idx, _ in enumerate(_flatten(val))]
                 kwarg_variables[key] = unflatten(temp, val)
 
-        Variable.free_param_values = np.array(list(_flatten(args)))
+        Variable.free_param_values = np.array(flat_args)
         Variable.kwarg_values = {k: np.array(list(_flatten(v))) for k, v in keyword_values.items()}
 
         # set up the context for Operation entry
@@ -355,7 +477,7 @@ class QNode:
                 # when only a single-mode sample is requested
                 self.output_conversion = np.squeeze
             else:
-                self.output_conversion = float
+                self.output_conversion = _float_output
 
             self.output_dim = 1
             res = (res,)
@@ -387,28 +509,144 @@ class QNode:
         self.ev = list(res)  #: list[Observable]: returned observables
         self.ops = self.queue + self.ev  #: list[Operation]: combined list of circuit operations
 
-        # classify the circuit contents
-        temp = [isinstance(op, pennylane.operation.CV) for op in self.ops if not isinstance(op, pennylane.ops.Identity)]
-        if all(temp):
+        # bind the operation classes locally, pennylane.operation imports this module
+        # so they cannot be imported at module level
+        Observable = pennylane.operation.Observable
+        CV = pennylane.operation.CV
+        Identity = pennylane.ops.Identity
+
+        #: tuple[str]: kind of each operation in self.ops, ``'E'`` for observables, ``'G'`` otherwise
+        self._op_kinds = tuple('E' if isinstance(op, Observable) else 'G' for op in self.ops)
+
+        # classify the circuit contents, Identity can be used in both CV and qubit circuits
+        is_cv = {isinstance(op, CV) for op in self.ops if not isinstance(op, Identity)}
+        if False not in is_cv:
             self.type = 'CV'
-        elif not True in temp:
+        elif True not in is_cv:
             self.type = 'qubit'
         else:
             raise QuantumFunctionError("Continuous and discrete operations are not "
                                        "allowed in the same quantum circuit.")
 
+        #: bool: True if any operation acts on wires given by free parameters or keyword arguments
+        self._free_wires = any(isinstance(w, Variable) for op in self.ops for w in op._wires)
+        self._wires_checked = False  #: bool: True if the wires of the circuit have been validated
+
+        # check that no wires are measured more than once
+        self._check_measured_wires()
+
+        #: set[int]: indices of the operations in self.ops that can affect the measured observables
+        self._light_cone = self._observable_light_cone()
+
         #----------------------------------------------------------
 
         # map each free variable to the operations which depend on it
-        self.variable_ops = {}
+        variable_ops = defaultdict(list)
         for k, op in enumerate(self.ops):
             for idx, p in enumerate(_flatten(op.params)):
-                if isinstance(p, Variable):
-                    if p.name is None: # ignore keyword arguments
-                        self.variable_ops.setdefault(p.idx, []).append((k, idx))
+                # ignore keyword arguments
+                if isinstance(p, Variable) and p.name is None:
+                    variable_ops[p.idx].append((k, idx))
+
+        self.variable_ops = dict(variable_ops)
 
         #: dict[int->str]: map from free parameter index to the gradient method to be used with that parameter
-        self.grad_method_for_par = {k: self._best_method(k) for k in self.variable_ops}
+        op_methods = {}  # best gradient method of each operation, shared between the free parameters
+        self.grad_method_for_par = {k: self._best_method(k, op_methods) for k in self.variable_ops}
+
+        #: dict[int->list[tuple]]: parameter-shift rule terms of the free parameters, see :meth:`_shift_terms`
+        self._shift_table = {}
+
+        if self.cache:
+            # store the constructed circuit for reuse with arguments of the same structure
+            self._structure = _structure_key(args, kwargs)
+            self._construct_cache[self._structure] = tuple(getattr(self, a) for a in _STRUCTURE_ATTRS)
+
+            if len(self._construct_cache) > self._construct_cache_size:
+                self._construct_cache.popitem(last=False)
+
+    def _check_measured_wires(self):
+        """Check that no wire is measured more than once.
+
+        Raises:
+            QuantumFunctionError: if a wire is measured more than once
+        """
+        m_wires = list(w for ex in self.ev for w in ex.wires)
+        if len(m_wires) != len(set(m_wires)):
+            raise QuantumFunctionError('Each wire in the quantum circuit can only be measured once.')
+
+    def _observable_light_cone(self):
+        """Operations that can affect the measured observables.
+
+        An operation acting on wires that are not connected to any measured wire
+        by the operations following it commutes with all the observables, and the
+        partial derivatives with respect to its parameters vanish.
+
+        Returns:
+            set[int]: indices of the operations in :attr:`ops` that belong to the
+            backward light cone of the observables
+        """
+        if self._free_wires:
+            # the wires depend on the arguments
+            return set(range(len(self.ops)))
+
+        cone = set()
+        wires = set()
+        for k in range(len(self.ops)-1, -1, -1):
+            op_wires = self.ops[k].wires
+            if self._op_kinds[k] == 'E' or not wires.isdisjoint(op_wires):
+                cone.add(k)
+                wires.update(op_wires)
+
+        return cone
+
+    def _check_wires(self):
+        """Check that the circuit only references existing wires,
+        and that no wire is measured more than once.
+
+        Raises:
+            QuantumFunctionError: if the wires of the circuit are invalid
+        """
+        if self._free_wires:
+            # the measured wires depend on the arguments, see construct
+            self._check_measured_wires()
+
+        # make sure every gate/preparation and ev measurement only references existing wires
+        for op in self.ops:
+            for w in op.wires:
+                if w < 0 or w >= self.num_wires:
+                    raise QuantumFunctionError("Operation {} applied to invalid wire {} "
+                                               "on device with {} wires.".format(op.name, w, self.num_wires))
+
+    def _use_cached_structure(self, args, kwargs):
+        """Switch to the cached circuit matching the structure of the given arguments.
+
+        Only used in caching mode. If no circuit has been constructed for
+        this argument structure yet, it is constructed and cached.
+
+        Args:
+            args (tuple): positional arguments passed to the quantum function
+            kwargs (dict): keyword arguments passed to the quantum function
+        """
+        key = _structure_key(args, kwargs)
+
+        if key == self._structure:
+            return
+
+        cached = self._construct_cache.get(key)
+
+        if cached is None:
+            self.construct(args, kwargs)
+            return
+
+        self._construct_cache.move_to_end(key)
+
+        for attr, value in zip(_STRUCTURE_ATTRS, cached):
+            setattr(self, attr, value)
+
+        self._wires_checked = False
+
+        self._structure = key
 
     def _op_successors(self, o_idx, only='G'):
         """Successors of the given operation in the quantum circuit.
@@ -435,13 +673,11 @@ class QNode:
         #   succ = nx.dfs_preorder_nodes(self.DAG, op)
         #
         # if it is in a topological order? the docs aren't clear.
-        if only == 'E':
-            return list(filter(lambda x: isinstance(x, pennylane.operation.Observable), succ))
-        if only == 'G':
-            return list(filter(lambda x: not isinstance(x, pennylane.operation.Observable), succ))
+        if only in ('E', 'G'):
+            return [x for x, kind in zip(succ, self._op_kinds[o_idx+1:]) if kind == only]
         return succ
 
-    def _best_method(self, idx):
+    def _best_method(self, idx, op_methods=None):
         """Determine the correct gradient computation method for a free parameter.
 
         Use the analytic method iff every gate that depends on the parameter supports it.
@@ -452,6 +688,9 @@ class QNode:
 
         Args:
             idx (int): free parameter index
+            op_methods (dict[int->str]): Optional cache mapping operation indices to their best
+                gradient method. It is updated in place, and can be shared between calls
+                to avoid re-examining operations that depend on several free parameters.
         Returns:
             str: gradient method to be used
         """
@@ -473,11 +712,14 @@ class QNode:
         #
         # 5. Then run the standard discrete-case algorithm for determining the best gradient method
         # for every free parameter.
+        CV = pennylane.operation.CV
+        Variance = pennylane.operation.Variance
+
         def best_for_op(o_idx):
             "Returns the best gradient method for the operation op."
             op = self.ops[o_idx]
             # for discrete operations, other ops do not affect the choice
-            if not isinstance(op, pennylane.operation.CV):
+            if not isinstance(op, CV):
                 return op.grad_method
 
             # for CV ops it is more complicated
@@ -495,7 +737,7 @@ class QNode:
                         if x.ev_order is None:
                             return 'F'
                         if x.ev_order == 2:
-                            if x.return_type is pennylane.operation.Variance:
+                            if x.return_type is Variance:
                                 # second order observables don't support
                                 # analytic diff of variances
                                 return 'F'
@@ -508,8 +750,18 @@ class QNode:
 
         # indices of operations that depend on the free parameter idx
         ops = self.variable_ops[idx]
-        temp = [best_for_op(k) for k, _ in ops]
-        if all(k == 'A' for k in temp):
+
+        if op_methods is None:
+            op_methods = {}
+
+        # distinct gradient methods of the operations depending on the parameter
+        temp = set()
+        for k, _ in ops:
+            if k not in op_methods:
+                op_methods[k] = best_for_op(k)
+            temp.add(op_methods[k])
+
+        if temp == {'A'}:
             return 'A'
         elif None in temp:
             return None
@@ -532,10 +784,18 @@ class QNode:
         Returns:
             float, array[float]: output measured value(s)
         """
-        if not self.ops or not self.cache:
+        # flatten the positional arguments once; the flat list is reused below
+        flat_args = list(_flatten(args))
+
+        if self._structure_locked:
+            # Evaluation within QNode.jacobian, which has already constructed
+            # the circuit for the same keyword arguments. Only the parameter
+            # values differ, and these are passed via Variable.free_param_values.
+            pass
+        elif not self.ops or not self.cache:
             if self.num_variables is not None:
                 # circuit construction has previously been called
-                if len(list(_flatten(args))) == self.num_variables:
+                if len(flat_args) == self.num_variables:
                     # only construct the circuit if the number
                     # of arguments matches the allowed number
                     # of variables.
@@ -543,8 +803,7 @@ class QNode:
                     # via self._pd_analytic, where temporary
                     # variables are appended to the argument list.
 
-                    # flatten and unflatten arguments
-                    flat_args = list(_flatten(args))
+                    # unflatten arguments
                     shaped_args = unflatten(flat_args, self.model)
 
                     # construct the circuit
@@ -553,10 +812,13 @@ class QNode:
                 # circuit has not yet been constructed
                 # construct the circuit
                 self.construct(args, kwargs)
+        else:
+            # caching mode: use the circuit constructed for this argument structure
+            self._use_cached_structure(args, kwargs)
 
         # temporarily store keyword arguments
         keyword_values = {}
-        keyword_values.update({k: np.array(list(_flatten(v))) for k, v in self.keyword_defaults.items()})
+        keyword_values.update(self._flat_keyword_defaults)
         keyword_values.update({k: np.array(list(_flatten(v))) for k, v in kwargs.items()})
 
         # Try and insert kwargs-as-positional back into the kwargs dictionary.
@@ -572,30 +834,59 @@ class QNode:
         # keyword_values.update(kwargs_as_position)
 
         # temporarily store the free parameter values in the Variable class
-        Variable.free_param_values = np.array(list(_flatten(args)))
+        Variable.free_param_values = np.array(flat_args)
         Variable.kwarg_values = keyword_values
 
+        # Evaluations within QNode.jacobian modify the circuit parameters,
+        # so their results must not be stored.
+        key = None
+        if self.cache and self.result_cache_size and not self._structure_locked:
+            key = self._result_key(flat_args, keyword_values)
+            if key in self._result_cache:
+                self._result_cache.move_to_end(key)
+                return self.output_conversion(np.array(self._result_cache[key]))
+
         self.device.reset()
 
-        # check that no wires are measured more than once
-        m_wires = list(w for ex in self.ev for w in ex.wires)
-        if len(m_wires) != len(set(m_wires)):
-            raise QuantumFunctionError('Each wire in the quantum circuit can only be measured once.')
+        if self._free_wires or not self._wires_checked:
+            # unless they depend on the arguments, the wires
+            # only need to be checked once per circuit structure
+            self._check_wires()
+            self._wires_checked = True
 
-        def check_op(op):
-            """Make sure only existing wires are referenced."""
-            for w in op.wires:
-                if w < 0 or w >= self.num_wires:
-                    raise QuantumFunctionError("Operation {} applied to invalid wire {} "
-                                               "on device with {} wires.".format(op.name, w, self.num_wires))
+        ret = self.device.execute(self.queue, self.ev, self.variable_ops)
 
-        # check every gate/preparation and ev measurement
-        for op in self.ops:
-            check_op(op)
+        if key is not None:
+            self._result_cache[key] = np.array(ret)
+            if len(self._result_cache) > self.result_cache_size:
+                self._result_cache.popitem(last=False)
 
-        ret = self.device.execute(self.queue, self.ev, self.variable_ops)
         return self.output_conversion(ret)
 
+    def _result_key(self, flat_args, keyword_values):
+        """Key identifying the result of an evaluation in caching mode.
+
+        Args:
+            flat_args (list): flattened positional arguments
+            keyword_values (dict[str->array]): flattened keyword argument values
+
+        Returns:
+            tuple or None: hashable key, or None if the result should not be stored
+        """
+        if any(e.return_type is pennylane.operation.Sample for e in self.ev):
+            # samples are random, each evaluation must return new ones
+            return None
+
+        key = (self._structure, tuple(flat_args), tuple(sorted((k, tuple(v.flat)) for k, v in keyword_values.items())))
+
+        try:
+            hash(key)
+        except TypeError:
+            # unhashable argument values
+            return None
+
+        return key
+
     def evaluate_obs(self, obs, args, **kwargs):
         """Evaluate the value of the given observables.
 
@@ -610,7 +901,7 @@ class QNode:
         """
         # temporarily store keyword arguments
         keyword_values = {}
-        keyword_values.update({k: np.array(list(_flatten(v))) for k, v in self.keyword_defaults.items()})
+        keyword_values.update(self._flat_keyword_defaults)
         keyword_values.update({k: np.array(list(_flatten(v))) for k, v in kwargs.items()})
 
         # temporarily store the free parameter values in the Variable class
@@ -647,6 +938,12 @@ class QNode:
            since it compares the output at two points infinitesimally close to each other. Hence the
            'F' method requires exact expectation values, i.e., `shots=0`.
 
+        .. note::
+           The circuit evaluations are executed sequentially, within a single device session
+           (see :meth:`~.Device.session`). They cannot be run concurrently, since they share
+           the state of the device as well as the free parameter values stored in
+           :class:`~.variable.Variable`.
+
         Args:
             params (nested Sequence[Number], Number): point in parameter space at which
                 to evaluate the gradient
@@ -674,10 +971,14 @@ class QNode:
             params = (params,)
 
         circuit_kwargs = pop_jacobian_kwargs(kwargs)
+        force_order2 = kwargs.get('force_order2', False)
 
         if not self.ops or not self.cache:
             # construct the circuit
             self.construct(params, circuit_kwargs)
+        else:
+            # caching mode: use the circuit constructed for this argument structure
+            self._use_cached_structure(params, circuit_kwargs)
 
         sample_ops = [e for e in self.ev if e.return_type is pennylane.operation.Sample]
         if sample_ops:
@@ -690,6 +991,8 @@ class QNode:
         if which is None:
             which = range(len(flat_params))
         else:
+            # the Jacobian columns are indexed by position in which
+            which = list(which)
             if min(which) < 0 or max(which) >= self.num_variables:
                 raise ValueError("Tried to compute the gradient wrt. free parameters {} "
                                  "(this node has {} free parameters).".format(which, self.num_variables))
@@ -727,61 +1030,96 @@ class QNode:
 
         variances = any(e.return_type is pennylane.operation.Variance for e in self.ev)
 
-        # compute the partial derivative w.r.t. each parameter using the proper method
-        grad = np.zeros((self.output_dim, len(which)), dtype=float)
-
+        # Jacobian columns grouped by gradient method, the columns of
+        # unused parameters are left as zeros
+        method_cols = defaultdict(list)
         for i, k in enumerate(which):
-            if k not in self.variable_ops:
-                # unused parameter
-                continue
+            if k in self.variable_ops:
+                method_cols[method[k]].append(i)
 
-            par_method = method[k]
-            if par_method == 'A':
-                if variances:
-                    grad[:, i] = self._pd_analytic_var(flat_params, k, **kwargs)
-                else:
-                    grad[:, i] = self._pd_analytic(flat_params, k, **kwargs)
-            elif par_method == 'F':
-                grad[:, i] = self._pd_finite_diff(flat_params, k, h, order, y0, **kwargs)
-            else:
-                raise ValueError('Unknown gradient method.')
+        if not set(method_cols) <= {'A', 'F'}:
+            raise ValueError('Unknown gradient method.')
+
+        # columns and parameter indices of the finite difference partial derivatives
+        fd_cols = method_cols['F']
+        fd_idxs = [which[i] for i in fd_cols]
+
+        # the analytic method to use for all the analytic partial derivatives
+        pd_analytic = self._pd_analytic_var if variances else self._pd_analytic
+
+        # compute the partial derivative w.r.t. each parameter using the proper method
+        # the Jacobian is filled column by column, so the columns are stored contiguously
+        grad = np.zeros((self.output_dim, len(which)), dtype=float, order='F')
+
+        # the circuit evaluations below only use shifted or temporary parameters,
+        # so they reuse the circuit constructed above
+        self._structure_locked = True
+        self._heisenberg_cache = {}
+        self._heisenberg_obs = {}
+        self._var_expvals = None
+        self._squared_observables = {}
+
+        # the partial derivative methods receive the keyword arguments of the
+        # quantum function only, the jacobian specific ones were removed above
+        try:
+            # all the shifted circuits are executed within a single device session,
+            # so the device execution context is only set up once per Jacobian
+            with self.device.session():
+                if fd_cols:
+                    grad[:, fd_cols] = self._pd_finite_diff_batch(flat_params, fd_idxs, h, order, y0, **circuit_kwargs)
+
+                for i in method_cols['A']:
+                    grad[:, i] = pd_analytic(flat_params, which[i], force_order2=force_order2, **circuit_kwargs)
+        finally:
+            self._structure_locked = False
+            self._heisenberg_cache = {}
+            self._heisenberg_obs = {}
+            self._var_expvals = None
+            self._squared_observables = {}
 
         return grad
 
-    def _pd_finite_diff(self, params, idx, h=1e-7, order=1, y0=None, **kwargs):
-        """Partial derivative of the node using the finite difference method.
+    def _pd_finite_diff_batch(self, params, idxs, h=1e-7, order=1, y0=None, **kwargs):
+        """Partial derivatives of the node with respect to several parameters
+        using the finite difference method.
+
+        All the shifted parameter vectors are built at once, one row per partial derivative.
 
         Args:
             params (array[float]): point in parameter space at which to evaluate
-                the partial derivative
-            idx (int): return the partial derivative with respect to this parameter
+                the partial derivatives
+            idxs (Sequence[int]): return the partial derivatives with respect to these parameters
             h (float): step size
             order (int): finite difference method order, 1 or 2
             y0 (float): Value of the circuit at params. Should only be computed once.
 
         Returns:
-            float: partial derivative of the node.
+            array[float]: partial derivatives of the node, one column per parameter in ``idxs``
         """
-        circuit_kwargs = pop_jacobian_kwargs(kwargs)
+        rows = np.arange(len(idxs))
+        # the shifted parameters are floats, even if the circuit was called with integers
+        shift_params = np.tile(np.asarray(params, dtype=float), (len(idxs), 1))
+
+        def evaluate_rows(shift):
+            """Evaluates the circuit once for each row of shifted parameters."""
+            return np.array([np.asarray(self.evaluate(p, **kwargs)) for p in shift])
 
-        shift_params = params.copy()
         if order == 1:
-            # shift one parameter by h
-            shift_params[idx] += h
-            y = np.asarray(self.evaluate(shift_params, **circuit_kwargs))
-            return (y-y0) / h
+            # shift one parameter by h in each row
+            shift_params[rows, idxs] += h
+            y = evaluate_rows(shift_params)
+            return ((y-y0) / h).T
         elif order == 2:
             # symmetric difference
-            # shift one parameter by +-h/2
-            shift_params[idx] += 0.5*h
-            y2 = np.asarray(self.evaluate(shift_params, **circuit_kwargs))
-            shift_params[idx] = params[idx] -0.5*h
-            y1 = np.asarray(self.evaluate(shift_params, **circuit_kwargs))
-            return (y2-y1) / h
+            # shift one parameter by +-h/2 in each row
+            shift_params[rows, idxs] += 0.5*h
+            y2 = evaluate_rows(shift_params)
+            shift_params[rows, idxs] = params[idxs] - 0.5*h
+            y1 = evaluate_rows(shift_params)
+            return ((y2-y1) / h).T
         else:
             raise ValueError('Order must be 1 or 2.')
 
-
     def _pd_analytic(self, params, idx, force_order2=False, **kwargs):
         """Partial derivative of the node using the analytic method.
 
@@ -798,14 +1136,21 @@ class QNode:
         Returns:
             float: partial derivative of the node.
         """
-        # remove jacobian specific keyword arguments
-        circuit_kwargs = pop_jacobian_kwargs(kwargs)
-
         n = self.num_variables
         w = self.num_wires
         pd = 0.0
+
+        # shifted parameter values, only the temporary parameter with index n
+        # differs between the terms of the product rule
+        shift_p1 = np.empty(n+1)
+        shift_p1[:n] = params
+        shift_p2 = shift_p1.copy()
+
+        if idx not in self._shift_table:
+            self._shift_table[idx] = self._shift_terms(idx)
+
         # find the Commands in which the free parameter appears, use the product rule
-        for o_idx, p_idx in self.variable_ops[idx]:
+        for o_idx, p_idx, multiplier, shift in self._shift_table[idx]:
             op = self.ops[o_idx]
 
             # we temporarily edit the Operation such that parameter p_idx is replaced by a new one,
@@ -813,77 +1158,49 @@ class QNode:
             orig = op.params[p_idx]
             assert orig.idx == idx
 
-            # reference to a new, temporary parameter with index n, otherwise identical with orig
-            temp_var = copy.copy(orig)
+            # reference to a temporary parameter with index n, otherwise identical with orig;
+            # only one Operation parameter is replaced at a time, so the same Variable is reused
+            temp_var = self._temp_var
             temp_var.idx = n
+            temp_var.name = orig.name
+            temp_var.mult = orig.mult
             op.params[p_idx] = temp_var
 
-            # get the gradient recipe for this parameter
-            recipe = op.grad_recipe[p_idx]
-            multiplier = 0.5 if recipe is None else recipe[0]
-            multiplier *= orig.mult
-
-            # shift the temp parameter value by +- this amount
-            shift = np.pi / 2 if recipe is None else recipe[1]
-            shift /= orig.mult
-
             # shifted parameter values
-            shift_p1 = np.r_[params, params[idx] +shift]
-            shift_p2 = np.r_[params, params[idx] -shift]
+            shift_p1[n] = params[idx] +shift
+            shift_p2[n] = params[idx] -shift
 
             if not force_order2 and op.grad_method != 'A2':
                 # basic analytic method, for discrete gates and gaussian CV gates succeeded by order-1 observables
                 # evaluate the circuit in two points with shifted parameter values
-                y2 = np.asarray(self.evaluate(shift_p1, **circuit_kwargs))
-                y1 = np.asarray(self.evaluate(shift_p2, **circuit_kwargs))
+                y2 = np.asarray(self.evaluate(shift_p1, **kwargs))
+                y1 = np.asarray(self.evaluate(shift_p2, **kwargs))
                 pd += (y2-y1) * multiplier
             else:
                 # order-2 method, for gaussian CV gates succeeded by order-2 observables
                 # evaluate transformed observables at the original parameter point
                 # first build the Z transformation matrix
-                Variable.free_param_values = shift_p1
-                Z2 = op.heisenberg_tr(w)
-                Variable.free_param_values = shift_p2
-                Z1 = op.heisenberg_tr(w)
-                Z = (Z2-Z1) * multiplier  # derivative of the operation
-
                 unshifted_params = np.r_[params, params[idx]]
                 Variable.free_param_values = unshifted_params
+
+                # the shifted transformations only differ in the value of the temporary
+                # parameter, so they are built directly from the operation parameters
+                # pylint: disable=protected-access
+                p = op.parameters
+                p[p_idx] = shift_p1[n] * orig.mult
+                Z2 = op.heisenberg_expand(op._heisenberg_rep(p), w)
+                p[p_idx] = shift_p2[n] * orig.mult
+                Z1 = op.heisenberg_expand(op._heisenberg_rep(p), w)
                 Z0 = op.heisenberg_tr(w, inverse=True)
-                Z = Z @ Z0
-
-                # conjugate Z with all the following operations
-                B = np.eye(1 +2*w)
-                B_inv = B.copy()
-                for BB in self._op_successors(o_idx, 'G'):
-                    temp = BB.heisenberg_tr(w)
-                    B = temp @ B
-                    temp = BB.heisenberg_tr(w, inverse=True)
-                    B_inv = B_inv @ temp
-                Z = B @ Z @ B_inv  # conjugation
-
-                # ev_successors = self._op_successors(o_idx, 'E')
-
-                def tr_obs(ex):
-                    """Transform the observable"""
-                    # TODO: At initial release, since we use a queue to represent circuit, all expectations values
-                    # are successors to all gates in the same circuit.
-                    # When library uses a DAG representation for circuits, uncomment following if statement
-
-                    ## if ex is not a successor of op, multiplying by Z should do nothing.
-                    #if ex not in ev_successors:
-                    #    return ex
-                    q = ex.heisenberg_obs(w)
-                    qp = q @ Z
-                    if q.ndim == 2:
-                        # 2nd order observable
-                        qp = qp +qp.T
-                    return pennylane.expval(pennylane.PolyXP(qp, wires=range(w), do_queue=False))
+
+                # derivative of the operation, conjugated with all the following operations
+                B, B_inv = self._successor_transforms(o_idx)
+                Z = _transformed_derivative(Z2, Z1, Z0, B, B_inv, multiplier)
 
                 # transform the observables
-                obs = list(map(tr_obs, self.ev))
+                obs = self._transformed_observables(Z)
                 # measure transformed observables
-                temp = self.evaluate_obs(obs, unshifted_params, **circuit_kwargs)
+                temp = self.evaluate_obs(obs, unshifted_params, **kwargs)
                 pd += temp
 
             # restore the original parameter
@@ -891,111 +1208,254 @@ class QNode:
 
         return pd
 
-    def _pd_analytic_var(self, param_values, param_idx, **kwargs):
-        """Partial derivative of variances of observables using the analytic method.
+    def _shift_terms(self, idx):
+        """Parameter-shift rule terms of a free parameter.
+
+        The terms only depend on the circuit structure. :meth:`_pd_analytic`
+        stores them in :attr:`_shift_table` for reuse.
 
         Args:
-            param_values (array[float]): point in free parameter space at which
-                to evaluate the partial derivative
-            param_idx (int): return the partial derivative with respect to this
-                free parameter
+            idx (int): free parameter index
 
         Returns:
-            float: partial derivative of the node.
+            list[(int, int, float, float)]: tuples ``(o_idx, p_idx, multiplier, shift)``,
+            one for each operation parameter depending on the free parameter
+            (see :attr:`variable_ops`) that can affect the measured observables
         """
-        old_ev = copy.deepcopy(self.ev)
+        terms = []
+        for o_idx, p_idx in self.variable_ops[idx]:
+            if o_idx not in self._light_cone:
+                # the operation commutes with all the observables,
+                # so this term of the product rule vanishes
+                continue
 
-        # boolean mask: elements are True where the
-        # return type is a variance, False for expectations
-        where_var = [e.return_type is pennylane.operation.Variance for e in self.ev]
+            op = self.ops[o_idx]
+            mult = op.params[p_idx].mult
 
-        for i, e in enumerate(self.ev):
-            # iterate through all observables
-            # here, i is the index of the observable
-            # and e is the observable
+            # get the gradient recipe for this parameter
+            recipe = op.grad_recipe[p_idx]
+            multiplier = 0.5 if recipe is None else recipe[0]
+            multiplier *= mult
 
-            if e.return_type is not pennylane.operation.Variance:
-                # if the expectation value is not a variance
-                # continue on to the next loop iteration
-                continue
+            # shift the temp parameter value by +- this amount
+            shift = np.pi / 2 if recipe is None else recipe[1]
+            shift /= mult
+
+            terms.append((o_idx, p_idx, multiplier, shift))
+
+        return terms
+
+    def _transformed_observables(self, Z):
+        """Transform the measured observables with the derivative of an operation,
+        used in the order-2 analytic method.
+
+        The Heisenberg representations of the observables are evaluated at the
+        unshifted parameter values, so they are cached for the duration of
+        :meth:`jacobian`. The first and second order observables are each
+        transformed with a single stacked matrix product.
+
+        Args:
+            Z (array[float]): Heisenberg picture derivative of the operation
+
+        Returns:
+            list[:class:`~.operation.Observable`]: transformed observables, with expectation return type
+        """
+        # TODO: At initial release, since we use a queue to represent circuit, all expectations values
+        # are successors to all gates in the same circuit.
+        # When library uses a DAG representation for circuits, observables that
+        # are not successors of the operation should not be transformed.
+        w = self.num_wires
+
+        # the measured observables differ between the calls from _pd_analytic_var
+        key = tuple(id(ex) for ex in self.ev)
+        if key not in self._heisenberg_obs:
+            qs = [ex.heisenberg_obs(w) for ex in self.ev]
+            first = [i for i, q in enumerate(qs) if q.ndim == 1]
+            second = [i for i, q in enumerate(qs) if q.ndim == 2]
+            self._heisenberg_obs[key] = (first, np.array([qs[i] for i in first]),
+                                         second, np.array([qs[i] for i in second]))
+
+        first, Q1, second, Q2 = self._heisenberg_obs[key]
+        qp = [None] * len(self.ev)
+
+        if first:
+            for i, q in zip(first, Q1 @ Z):
+                qp[i] = q
+
+        if second:
+            # 2nd order observables
+            Q2 = Q2 @ Z
+            for i, q in zip(second, Q2 + np.swapaxes(Q2, 1, 2)):
+                qp[i] = q
+
+        return [pennylane.expval(pennylane.PolyXP(q, wires=range(w), do_queue=False)) for q in qp]
+
+    def _successor_transforms(self, o_idx):
+        """Combined Heisenberg picture transformation of the successors of an operation,
+        used in the order-2 analytic method.
+
+        Successor operations are evaluated at the unshifted parameter values, which are
+        the same for every partial derivative of a Jacobian. The products of their
+        transformations are therefore computed for all operations at once, in a single
+        backward pass over the circuit, and cached for the duration of :meth:`jacobian`.
+
+        Args:
+            o_idx (int): index of the operation in the operation queue
+
+        Returns:
+            tuple[array[float]]: the product of the transformations of all successor
+            operations, and the product of their inverse transformations
+        """
+        if not self._heisenberg_cache:
+            w = self.num_wires
+            last = len(self.ops)-1
+
+            # the products are written in place into preallocated stacks,
+            # the cached matrices are views into them
+            B = np.empty((last+1, 1 +2*w, 1 +2*w))
+            B_inv = np.empty_like(B)
+
+            # products over the operations following the last one are identities
+            B[last] = np.eye(1 +2*w)
+            B_inv[last] = B[last]
+            self._heisenberg_cache[last] = (B[last], B_inv[last])
+
+            for k in range(last, 0, -1):
+                if self._op_kinds[k] == 'G':
+                    op = self.ops[k]
+                    if not op.supports_heisenberg:
+                        # the operations preceding a non-Gaussian one
+                        # do not use the order-2 method
+                        break
+                    np.matmul(B[k], op.heisenberg_tr(w), out=B[k-1])
+                    np.matmul(op.heisenberg_tr(w, inverse=True), B_inv[k], out=B_inv[k-1])
+                else:
+                    B[k-1] = B[k]
+                    B_inv[k-1] = B_inv[k]
 
-            # temporarily convert return type to expectation
-            self.ev[i].return_type = pennylane.operation.Expectation
+                # products over the successors of operation k-1
+                self._heisenberg_cache[k-1] = (B[k-1], B_inv[k-1])
 
-            # analytic derivative of <A^2>
-            # For involutory observables (A^2 = I),
-            # then d<I>/dp = 0
-            pdA2 = 0
+        return self._heisenberg_cache[o_idx]
 
-            if self.type == 'qubit':
-                if e.__class__.__name__ == 'Hermitian':
-                    # since arbitrary Hermitian observables
-                    # are not guaranteed to be involutory, need to take them into
-                    # account separately to calculate d<A^2>/dp
+    def _squared_observable(self, obs):
+        r"""Expectation of the square of an observable, used in the analytic variance gradient.
+
+        Args:
+            obs (:class:`~.operation.Observable`): observable whose variance is measured
+
+        Returns:
+            :class:`~.operation.Observable` or None: :math:`\langle A^2\rangle` expectation,
+            or None for involutory qubit observables (:math:`A^2=I`)
+        """
+        w = obs.wires
 
-                    A = e.params[0]  # Hermitian matrix
-                    w = e.wires
+        if self.type == 'qubit':
+            if obs.__class__.__name__ != 'Hermitian':
+                # all other qubit observables are involutory
+                return None
 
-                    if not np.allclose(A @ A, np.identity(A.shape[0])):
-                        # make a copy of the original variance
-                        old = copy.deepcopy(e)
+            # since arbitrary Hermitian observables
+            # are not guaranteed to be involutory, need to take them into
+            # account separately to calculate d<A^2>/dp
+            A = obs.params[0]  # Hermitian matrix
+            A2 = A @ A
 
-                        # replace the Hermitian variance with <A^2> expectation
-                        self.ev[i] = pennylane.expval(pennylane.ops.Hermitian(A @ A, w, do_queue=False))
+            if np.allclose(A2, np.identity(A.shape[0])):
+                return None
 
-                        # calculate the analytic derivative of <A^2>
-                        pdA2 = np.asarray(self._pd_analytic(param_values, param_idx, **kwargs))
+            return pennylane.expval(pennylane.ops.Hermitian(A2, w, do_queue=False))
 
-                        # restore the original Hermitian variance
-                        self.ev[i] = old
+        # get the heisenberg representation
+        # This will be a real 1D vector representing the
+        # first order observable in the basis [I, x, p]
+        A = obs._heisenberg_rep(obs.parameters) # pylint: disable=protected-access
 
-            elif self.type == 'CV':
-                # need to calculate d<A^2>/dp
-                # make a copy of the original variance
-                old = copy.deepcopy(e)
-                w = old.wires
+        # make this a row vector by adding an extra dimension
+        A = np.expand_dims(A, axis=0)
+
+        # take the outer product of the heisenberg representation
+        # with itself, to get a square symmetric matrix representing
+        # the square of the observable
+        A = np.kron(A, A.T)
+
+        return pennylane.expval(pennylane.ops.PolyXP(A, w, do_queue=False))
+
+    def _pd_analytic_var(self, param_values, param_idx, force_order2=False, **kwargs):
+        """Partial derivative of variances of observables using the analytic method.
+
+        Args:
+            param_values (array[float]): point in free parameter space at which
+                to evaluate the partial derivative
+            param_idx (int): return the partial derivative with respect to this
+                free parameter
+            force_order2 (bool): if True, use the order-2 method even if not necessary
 
-                # get the heisenberg representation
-                # This will be a real 1D vector representing the
-                # first order observable in the basis [I, x, p]
-                A = e._heisenberg_rep(old.parameters) # pylint: disable=protected-access
+        Returns:
+            float: partial derivative of the node.
+        """
+        # The observables are modified in place below, only their return
+        # types and positions in the return queue need to be restored.
+        old_ev = list(self.ev)
+        old_return_types = [e.return_type for e in self.ev]
 
-                # make this a row vector by adding an extra dimension
-                A = np.expand_dims(A, axis=0)
+        # boolean mask: elements are True where the
+        # return type is a variance, False for expectations
+        where_var = [r is pennylane.operation.Variance for r in old_return_types]
 
-                # take the outer product of the heisenberg representation
-                # with itself, to get a square symmetric matrix representing
-                # the square of the observable
-                A = np.kron(A, A.T)
+        # the <A^2> observables do not depend on the free parameters,
+        # so they are only built once per Jacobian
+        if not self._squared_observables:
+            self._squared_observables = {i: self._squared_observable(e)
+                                         for i, e in enumerate(self.ev) if where_var[i]}
 
-                # replace the first order observable var(A) with <A^2>
-                # in the return queue
-                self.ev[i] = pennylane.expval(pennylane.ops.PolyXP(A, w, do_queue=False))
+        # boolean mask: elements are True where d<A^2>/dp must be computed,
+        # for involutory observables (A^2 = I) d<I>/dp = 0
+        where_A2 = [self._squared_observables.get(i) is not None for i in range(len(self.ev))]
 
-                # calculate the analytic derivative of <A^2>
+        for i, e in enumerate(self.ev):
+            if where_var[i]:
+                # temporarily convert return type to expectation
+                e.return_type = pennylane.operation.Expectation
+
+        # analytic derivative of <A^2>
+        pdA2 = 0
+
+        if any(where_A2):
+            # replace the variances with <A^2> expectations in the return queue,
+            # so that the derivatives of all of them are computed at once
+            for i, A2 in self._squared_observables.items():
+                if A2 is not None:
+                    self.ev[i] = A2
+
+            # calculate the analytic derivative of <A^2>
+            if self.type == 'CV':
                 pdA2 = np.asarray(self._pd_analytic(param_values, param_idx, force_order2=True, **kwargs))
+            else:
+                pdA2 = np.asarray(self._pd_analytic(param_values, param_idx, force_order2=force_order2, **kwargs))
+
+            pdA2 = np.where(where_A2, pdA2, 0)
 
-                # restore the original observable
-                self.ev[i] = old
+            # restore the original observables
+            self.ev[:] = old_ev
 
-        # save original cache setting
-        cache = self.cache
-        # Make sure caching is on. If it is not on,
-        # the circuit will be reconstructed when self.evaluate is
-        # called, overwriting the temporary change we made to
-        # self.ev, where we set the return_type of every observable
-        # to :attr:`ObservableReturnTypes.Expectation`.
-        self.cache = True
+        # The circuit structure is locked within QNode.jacobian, so
+        # self.evaluate does not reconstruct the circuit and overwrite the
+        # temporary change we made to self.ev, where we set the return_type
+        # of every observable to :attr:`ObservableReturnTypes.Expectation`.
 
-        # evaluate circuit value at original parameters
-        evA = np.asarray(self.evaluate(param_values, **kwargs))
+        # evaluate circuit value at original parameters, this does not
+        # depend on param_idx and is computed once per Jacobian
+        if self._var_expvals is None:
+            self._var_expvals = np.asarray(self.evaluate(param_values, **kwargs))
+        evA = self._var_expvals
         # evaluate circuit gradient assuming all outputs are expectations
-        pdA = self._pd_analytic(param_values, param_idx, **kwargs)
+        pdA = self._pd_analytic(param_values, param_idx, force_order2=force_order2, **kwargs)
 
-        # restore original return queue
+        # restore original return queue and return types
         self.ev = old_ev
-        # restore original caching setting
-        self.cache = cache
+        for e, r in zip(old_ev, old_return_types):
+            e.return_type = r
 
         # return the variance shift rule where where_var==True,
         # otherwise return the expectation parameter shift rule
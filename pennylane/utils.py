@@ -55,7 +55,11 @@ def _flatten(x):
         other: elements of x in depth-first order
     """
     if isinstance(x, np.ndarray):
-        yield from _flatten(x.flat)  # should we allow object arrays? or just "yield from x.flat"?
+        if x.dtype != object:
+            # elements of numeric arrays are scalars, no need to recurse into them
+            yield from x.flat
+        else:
+            yield from _flatten(x.flat)  # should we allow object arrays? or just "yield from x.flat"?
     elif isinstance(x, Iterable) and not isinstance(x, (str, bytes)):
         for item in x:
             yield from _flatten(item)
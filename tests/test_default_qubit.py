@@ -479,6 +479,79 @@ class TestApply:
             qubit_device_2_wires.apply("BasisState", wires=[0, 1, 2], par=[np.array([0, 1])])
 
 
+class TestPrepareQueue:
+    """Tests that single-qubit gates are fused before being applied."""
+
+    def test_single_qubit_gates_are_fused(self, qubit_device_2_wires, tol):
+        """Tests that consecutive single-qubit gates on a wire are fused into one unitary,
+           and that gates on other wires are only applied once the wire is used"""
+
+        schedule = [
+            ("RX", [0], [0.432]),
+            ("Hadamard", [1], []),
+            ("RY", [0], [-0.12]),
+            ("CNOT", [0, 1], []),
+            ("PauliX", [0], []),
+        ]
+
+        res = qubit_device_2_wires.prepare_queue(schedule)
+
+        assert [op[0] for op in res] == ["QubitUnitary", "Hadamard", "CNOT", "PauliX"]
+        assert res[0][1] == [0]
+        assert np.allclose(res[0][2][0], Roty(-0.12) @ Rotx(0.432), atol=tol, rtol=0)
+
+    def test_state_preparation_flushes_all_wires(self, qubit_device_2_wires):
+        """Tests that pending gates are applied before a state preparation without wires"""
+
+        schedule = [("PauliX", [1], []), ("BasisState", [], [np.array([1, 0])])]
+        assert qubit_device_2_wires.prepare_queue(schedule) == schedule
+
+    def test_single_gates_are_not_rebuilt(self, qubit_device_2_wires, monkeypatch):
+        """Tests that the matrices of gates that are not fused are not built"""
+
+        schedule = [("RX", [0], [0.432]), ("CNOT", [0, 1], []), ("RY", [1], [-0.12])]
+
+        calls = []
+        monkeypatch.setattr(qubit_device_2_wires, "_get_operator_matrix", lambda *args: calls.append(args))
+
+        assert qubit_device_2_wires.prepare_queue(schedule) == schedule
+        assert calls == []
+
+    def test_fusion_can_be_switched_off(self):
+        """Tests that gates are not fused on a device created with supports_fusion=False,
+           and that other devices are not affected"""
+
+        schedule = [("RX", [0], [0.432]), ("RY", [0], [-0.12])]
+
+        dev = qml.device("default.qubit", wires=2, supports_fusion=False)
+        other_dev = qml.device("default.qubit", wires=2)
+
+        assert dev.prepare_queue(schedule) == schedule
+        assert [op[0] for op in other_dev.prepare_queue(schedule)] == ["QubitUnitary"]
+
+    def test_fused_circuit_agrees(self, tol):
+        """Tests that a circuit gives the same result with and without fusing gates"""
+        dev = qml.device("default.qubit", wires=3)
+
+        def circuit(x, y):
+            qml.RX(x, wires=0)
+            qml.RY(y, wires=0)
+            qml.Hadamard(wires=2)
+            qml.CNOT(wires=[0, 1])
+            qml.Rot(x, y, 0.3, wires=1)
+            qml.PhaseShift(y, wires=1)
+            qml.CRX(x, wires=[1, 2])
+            qml.RZ(y, wires=2)
+            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliY(1)), qml.expval(qml.PauliX(2))
+
+        fused = qml.QNode(circuit, dev)(0.54, -0.21)
+
+        dev = qml.device("default.qubit", wires=3, supports_fusion=False)
+        unfused = qml.QNode(circuit, dev)(0.54, -0.21)
+
+        assert np.allclose(fused, unfused, atol=tol, rtol=0)
+
+
 class TestExpval:
     """Tests that expectation values are properly calculated or that the proper errors are raised."""
 
@@ -16,6 +16,7 @@ Unit tests for the :mod:`pennylane` :class:`Device` class.
 """
 from unittest.mock import MagicMock, Mock, PropertyMock, patch
 
+import numpy as np
 import pytest
 import pennylane as qml
 from pennylane import Device, DeviceError
@@ -70,6 +71,46 @@ class TestDeviceSupportedLogic:
         assert not mock_device_with_observables.supports_observable("PauliY")
         assert not mock_device_with_observables.supports_observable(qml.PauliY)
 
+    def test_supports_operations_bulk(self, mock_device_with_operations):
+        """Checks that device.supports_operations returns a boolean mask
+           for a sequence of strings and Operation classes"""
+
+        res = mock_device_with_operations.supports_operations(
+            ["PauliX", qml.CNOT, "PauliY", qml.Hadamard]
+        )
+
+        assert res.dtype == bool
+        assert list(res) == [True, True, False, False]
+
+    def test_supports_observables_bulk(self, mock_device_with_observables):
+        """Checks that device.supports_observables returns a boolean mask
+           for a sequence of strings and Observable classes"""
+
+        res = mock_device_with_observables.supports_observables([qml.PauliZ, "PauliY"])
+
+        assert res.dtype == bool
+        assert list(res) == [True, False]
+
+    def test_supported_operations_are_cached(self):
+        """Checks that the operations and observables properties are only
+           evaluated once when checking for support"""
+
+        operations = PropertyMock(return_value=["PauliX", "PauliZ", "CNOT"])
+        observables = PropertyMock(return_value=["PauliZ"])
+
+        with patch.multiple(
+            Device, __abstractmethods__=set(), operations=operations, observables=observables
+        ):
+            dev = Device()
+
+            for _ in range(3):
+                assert dev.supports_operation("CNOT")
+                assert not dev.supports_operation(qml.Hadamard)
+                assert dev.supports_observable(qml.PauliZ)
+
+        assert operations.call_count == 1
+        assert observables.call_count == 1
+
     def test_supports_operation_exception(self, mock_device):
         """check that device.supports_operation raises proper errors
            if the argument is of the wrong type"""
@@ -162,6 +203,25 @@ class TestInternalFunctions:
         with pytest.raises(DeviceError, match="Observable Hadamard not supported on device"):
             mock_device_supporting_paulis.check_validity(queue, observables)
 
+    def test_check_validity_is_cached(self, mock_device_supporting_paulis):
+        """Tests that Device.check_validity only validates a given circuit structure once"""
+        queue = [qml.PauliX(wires=0, do_queue=False), qml.PauliY(wires=1, do_queue=False)]
+        observables = [qml.expval(qml.PauliZ(0, do_queue=False))]
+
+        dev = mock_device_supporting_paulis
+        dev._supported_operations = Mock(wraps=dev._supported_operations)
+
+        dev.check_validity(queue, observables)
+        dev.check_validity(queue, observables)
+        assert dev._supported_operations.call_count == 1
+
+        # an invalid circuit is never cached
+        invalid_queue = queue + [qml.Hadamard(wires=0, do_queue=False)]
+
+        for _ in range(2):
+            with pytest.raises(DeviceError, match="Gate Hadamard not supported on device"):
+                dev.check_validity(invalid_queue, observables)
+
 
 mock_device_capabilities = {
     "measurements": "everything",
@@ -169,6 +229,7 @@ mock_device_capabilities = {
 }
 
 
+
 @pytest.fixture(scope="function")
 def mock_device_with_capabilities():
     """A mock instance of the abstract Device class with non-empty observables"""
@@ -265,6 +326,41 @@ class TestOperations:
         assert call_history[1] == ["PauliY", [1], []]
         assert call_history[2] == ["PauliZ", [2], []]
 
+    def test_compile_queue(self, mock_device):
+        """Tests that compile_queue resolves the name, wires and parameters of each operation"""
+        queue = [
+            qml.RX(0.5, wires=0, do_queue=False),
+            qml.CNOT(wires=[1, 0], do_queue=False),
+        ]
+
+        assert mock_device.compile_queue(queue) == [("RX", [0], [0.5]), ("CNOT", [1, 0], [])]
+
+    def test_deferred_operations(self, mock_device_with_paulis_and_methods):
+        """Tests that deferrable operations are passed to apply_deferred in consecutive
+           runs, before the next non-deferrable operation and before post_apply"""
+        dev = mock_device_with_paulis_and_methods
+
+        queue = [
+            qml.PauliX(wires=0, do_queue=False),
+            qml.PauliZ(wires=1, do_queue=False),
+            qml.PauliY(wires=0, do_queue=False),
+            qml.PauliZ(wires=2, do_queue=False),
+        ]
+
+        observables = [qml.expval(qml.PauliZ(0, do_queue=False))]
+
+        call_history = []
+        dev.apply = Mock(wraps=lambda op, wires, params: call_history.append(op))
+        dev.apply_deferred = Mock(
+            wraps=lambda ops: call_history.append([op for op, _, _ in ops])
+        )
+
+        with patch.object(Device, "deferrable_operations", frozenset({"PauliX", "PauliZ"})):
+            with patch.object(Device, "post_apply", lambda self: call_history.append("post")):
+                dev.execute(queue, observables)
+
+        assert call_history == [["PauliX", "PauliZ"], "PauliY", ["PauliZ"], "post"]
+
     def test_unsupported_operations_raise_error(self, mock_device_with_paulis_and_methods):
         """Tests that the operations are properly applied and queued"""
         queue = [
@@ -414,6 +510,145 @@ class TestObservables:
         mock_device_with_paulis_and_methods.sample.assert_called_with("PauliZ", [2], [], 1)
 
 
+    def test_contiguous_expectations_are_batched(self, mock_device_with_paulis_and_methods):
+        """Check that contiguous expectation values are measured with a single
+           call to batch_expval, and that results keep the observable order"""
+
+        queue = [qml.PauliX(wires=0, do_queue=False)]
+
+        observables = [
+            qml.expval(qml.PauliZ(0, do_queue=False)),
+            qml.expval(qml.PauliX(1, do_queue=False)),
+            qml.var(qml.PauliZ(1, do_queue=False)),
+            qml.expval(qml.PauliY(2, do_queue=False)),
+        ]
+
+        batch_expval = Mock(side_effect=lambda names, wires, par: [len(w) for w in wires])
+        mock_device_with_paulis_and_methods.batch_expval = batch_expval
+        mock_device_with_paulis_and_methods.var = Mock(return_value=-1)
+
+        res = mock_device_with_paulis_and_methods.execute(queue, observables)
+
+        assert batch_expval.call_count == 2
+        batch_expval.assert_any_call(["PauliZ", "PauliX"], [[0], [1]], [[], []])
+        batch_expval.assert_any_call(["PauliY"], [[2]], [[]])
+        assert list(res) == [1, 1, -1, 1]
+
+
+    def test_results_without_samples_are_float_array(self, mock_device_with_paulis_and_methods):
+        """Check that results are returned as a flat float array when no
+           observable is sampled"""
+
+        queue = [qml.PauliX(wires=0, do_queue=False)]
+
+        observables = [
+            qml.expval(qml.PauliZ(0, do_queue=False)),
+            qml.var(qml.PauliZ(1, do_queue=False)),
+            qml.expval(qml.PauliX(2, do_queue=False)),
+        ]
+
+        res = mock_device_with_paulis_and_methods.execute(queue, observables)
+
+        assert res.dtype == np.float64
+        assert res.shape == (3,)
+
+
+    @pytest.mark.parametrize("return_types", [[qml.expval, qml.expval], [qml.expval, qml.var]])
+    def test_complex_results_are_kept(self, mock_device_with_paulis_and_methods, return_types):
+        """Check that complex values returned by a device are not cast to real"""
+
+        queue = [qml.PauliX(wires=0, do_queue=False)]
+
+        observables = [
+            return_type(qml.PauliZ(i, do_queue=False)) for i, return_type in enumerate(return_types)
+        ]
+
+        dev = mock_device_with_paulis_and_methods
+        dev.expval = Mock(return_value=1j)
+        dev.var = Mock(return_value=2j)
+
+        res = dev.execute(queue, observables)
+
+        assert res.dtype == np.complex128
+        assert np.all(res == np.array([1j, 1j if return_types[1] is qml.expval else 2j]))
+
+
+    def test_samples_are_stacked(self, mock_device_with_paulis_and_methods):
+        """Check that samples of equal size are returned as a two-dimensional
+           array with one row per observable"""
+
+        queue = [qml.PauliX(wires=0, do_queue=False)]
+
+        observables = [
+            qml.sample(qml.PauliZ(0, do_queue=False), 4),
+            qml.sample(qml.PauliX(1, do_queue=False), 4),
+        ]
+
+        dev = mock_device_with_paulis_and_methods
+        dev.sample = Mock(side_effect=lambda name, wires, par, n: [wires[0]] * n)
+
+        res = dev.execute(queue, observables)
+
+        assert res.shape == (2, 4)
+        assert np.all(res == np.array([[0] * 4, [1] * 4]))
+
+
+    def test_stacked_samples_keep_shape_and_type(self, mock_device_with_paulis_and_methods):
+        """Check that stacked samples keep the shape and type returned by the device,
+           for example for samples with one column per wire"""
+
+        queue = [qml.PauliX(wires=0, do_queue=False)]
+
+        observables = [
+            qml.sample(qml.PauliZ(0, do_queue=False), 4),
+            qml.sample(qml.PauliX(1, do_queue=False), 4),
+        ]
+
+        dev = mock_device_with_paulis_and_methods
+        dev.sample = Mock(side_effect=lambda name, wires, par, n: np.full((n, 2), wires[0]))
+
+        res = dev.execute(queue, observables)
+
+        assert res.shape == (2, 4, 2)
+        assert res.dtype == np.full(1, 0).dtype
+        assert np.all(res[0] == 0)
+        assert np.all(res[1] == 1)
+
+
+    def test_commuting_expectations_are_grouped(self, mock_device_with_paulis_and_methods):
+        """Check that batch_expval passes qubit-wise commuting groups of
+           observables to measure_commuting, and returns results in order"""
+        dev = mock_device_with_paulis_and_methods
+
+        names = ["PauliZ", "PauliX", "PauliZ", "Hermitian", "Identity"]
+        wires = [[0], [0], [1], [1], [0]]
+        par = [[], [], [], [np.identity(2)], []]
+
+        dev.measure_commuting = Mock(side_effect=lambda o, w, p: [w_[0] for w_ in w])
+
+        res = dev.batch_expval(names, wires, par)
+
+        groups = [call[0][0] for call in dev.measure_commuting.call_args_list]
+        assert groups == [["PauliZ", "PauliZ", "Identity"], ["PauliX", "Hermitian"]]
+        assert res == [0, 0, 1, 1, 0]
+
+    def test_expectations_measured_in_order(self, mock_device_with_paulis_and_methods):
+        """Check that batch_expval calls expval in the order of the observables if
+           the device does not overwrite measure_commuting"""
+        dev = mock_device_with_paulis_and_methods
+
+        names = ["PauliZ", "PauliX", "PauliZ", "Identity"]
+        wires = [[0], [0], [1], [0]]
+        par = [[], [], [], []]
+
+        dev.expval = Mock(side_effect=lambda o, w, p: w[0])
+
+        res = dev.batch_expval(names, wires, par)
+
+        assert [call[0][0] for call in dev.expval.call_args_list] == names
+        assert res == [0, 0, 1, 0]
+
+
 class TestParameters:
     """Test for checking device parameter mappings"""
 
@@ -471,6 +706,91 @@ class TestParameters:
         assert p_mapping == parameters
 
 
+    def test_parameters_are_read_only(self, mock_device):
+        """Tests that the parameter mapping cannot be modified by the device"""
+        queue = [qml.RX(0.1, wires=0, do_queue=False)]
+        observables = [qml.expval(qml.PauliZ(0, do_queue=False))]
+
+        def pre_measure(self):
+            self.parameters[1] = (0, 0)
+
+        with patch.object(Device, "pre_measure", pre_measure):
+            with pytest.raises(TypeError):
+                mock_device.execute(queue, observables, parameters={0: (0, 0)})
+
+    def test_parameters_default_empty(self, mock_device):
+        """Tests that the parameter mapping is empty if none is passed to execute"""
+        queue = [qml.RX(0.1, wires=0, do_queue=False)]
+        observables = [qml.expval(qml.PauliZ(0, do_queue=False))]
+
+        p_mapping = {}
+
+        with patch.object(Device, "pre_measure", lambda self: p_mapping.update(self.parameters)):
+            mock_device.execute(queue, observables)
+
+        assert p_mapping == {}
+
+    def test_parameters_view_is_reused(self, mock_device):
+        """Tests that repeated accesses within an execution return the same read-only view"""
+        queue = [qml.RX(0.1, wires=0, do_queue=False)]
+        observables = [qml.expval(qml.PauliZ(0, do_queue=False))]
+
+        views = []
+
+        with patch.object(Device, "pre_measure", lambda self: views.extend((self.parameters, self.parameters))):
+            mock_device.execute(queue, observables, parameters={0: (0, 0)})
+
+        assert views[0] is views[1]
+        assert views[0] == {0: (0, 0)}
+
+
+class TestBatchExecute:
+    """Tests for executing several circuits at once"""
+
+    def test_batch_execute(self, mock_device_with_paulis_and_methods):
+        """Tests that batch_execute executes every circuit in turn"""
+        dev = mock_device_with_paulis_and_methods
+        dev.execute = Mock(side_effect=lambda queue, obs, par: len(queue))
+
+        queues = [[qml.PauliX(wires=0, do_queue=False)] * n for n in range(1, 4)]
+        observables = [[qml.expval(qml.PauliZ(0, do_queue=False))]] * 3
+
+        res = dev.batch_execute(queues, observables)
+
+        assert res == [1, 2, 3]
+        assert dev.execute.call_count == 3
+        dev.execute.assert_called_with(queues[-1], observables[-1], None)
+
+    def test_batch_execute_length_mismatch(self, mock_device):
+        """Tests that batch_execute raises an error if the number of circuits is inconsistent"""
+        with pytest.raises(ValueError, match="number of queues, observable lists and parameter"):
+            mock_device.batch_execute([[]], [[], []])
+
+
+    def test_session_enters_context_once(self, mock_device_with_paulis_and_methods):
+        """Tests that executions within a session share one execution context"""
+        dev = mock_device_with_paulis_and_methods
+
+        context = MagicMock()
+        dev.execution_context = Mock(return_value=context)
+
+        queue = [qml.PauliX(wires=0, do_queue=False)]
+        observables = [qml.expval(qml.PauliZ(0, do_queue=False))]
+
+        with dev.session():
+            with dev.session():
+                dev.execute(queue, observables)
+            dev.execute(queue, observables)
+
+        assert dev.execution_context.call_count == 1
+        assert context.__enter__.call_count == 1
+        assert context.__exit__.call_count == 1
+
+        # outside of the session, the context is entered on every execution
+        dev.execute(queue, observables)
+        assert context.__enter__.call_count == 2
+
+
 class TestDeviceInit:
     """Tests for device loader in __init__.py"""
 
@@ -486,3 +806,19 @@ class TestDeviceInit:
         with patch.object(qml, "version", return_value="0.0.1"):
             with pytest.raises(DeviceError, match="plugin requires PennyLane versions"):
                 qml.device("default.qubit", wires=0)
+
+    def test_num_wires_is_int(self):
+        """Test that the number of wires is stored as a Python integer"""
+
+        with patch.multiple(Device, __abstractmethods__=set()):
+            dev = Device(wires=np.int64(3))
+
+        assert type(dev.num_wires) is int
+        assert dev.num_wires == 3
+
+    def test_num_wires_not_integer(self):
+        """Test that an exception is raised if the number of wires is not an integer"""
+
+        with patch.multiple(Device, __abstractmethods__=set()):
+            with pytest.raises(DeviceError, match="number of wires must be an integer"):
+                Device(wires=2.5)
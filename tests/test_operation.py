@@ -210,6 +210,27 @@ class BasicTest(BaseTest):
         except pennylane.QuantumFunctionError:
             self.fail("Operation failed to instantiate outside of QNode with do_queue=False.")
 
+    def test_fixed_wires(self):
+        """Test that the values of fixed wires are returned as a new list"""
+        self.logTestName()
+
+        op = pennylane.ops.CNOT(wires=[1, 0], do_queue=False)
+        wires = op.wires
+        self.assertEqual(wires, [1, 0])
+
+        # modifying the returned list does not change the operation
+        wires.append(2)
+        self.assertEqual(op.wires, [1, 0])
+
+    def test_fixed_bool_wires(self):
+        """Test that fixed wires given as bools are returned as plain integers"""
+        self.logTestName()
+
+        op = pennylane.ops.CNOT(wires=[True, False], do_queue=False)
+        wires = op.wires
+        self.assertEqual(wires, [1, 0])
+        self.assertTrue(all(type(w) is int for w in wires))
+
 
 class DeveloperTests(BaseTest):
     """Test custom operations construction."""
@@ -728,6 +728,37 @@ class TestQNodeGradients:
         expected_jacobian = -np.diag(np.sin(base_array))
         assert np.allclose(circuit_jacobian, expected_jacobian, atol=tol, rtol=0)
 
+    @pytest.mark.parametrize("method", ["A", "F"])
+    def test_which_as_set(self, qubit_device_2_wires, method, tol):
+        """Tests that the parameter indices can be given as any iterable, such as a set."""
+
+        def circuit(x, y):
+            qml.RX(x, wires=0)
+            qml.RY(y, wires=1)
+            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))
+
+        node = qml.QNode(circuit, qubit_device_2_wires)
+        par = [0.3, -0.7]
+
+        res = node.jacobian(par, which={0, 1}, method=method)
+        expected = node.jacobian(par, which=[0, 1], method=method)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("order", [1, 2])
+    def test_finite_diff_integer_parameters(self, qubit_device_2_wires, order):
+        """Tests that the finite difference Jacobian can be taken at integer parameter values."""
+
+        def circuit(x, y):
+            qml.RX(x, wires=0)
+            qml.RY(y, wires=1)
+            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))
+
+        node = qml.QNode(circuit, qubit_device_2_wires)
+
+        res = node.jacobian([1, 2], method="F", order=order, h=1e-6)
+        expected = -np.diag(np.sin([1, 2]))
+        assert np.allclose(res, expected, atol=1e-5, rtol=0)
+
     def test_qnode_cv_gradient_methods(self):
         """Tests the gradient computation methods on CV circuits."""
         # we can only use the 'A' method on parameters which only affect gaussian operations
@@ -782,6 +813,13 @@ class TestQNodeGradients:
 
         check_methods(qf, {0: "A", 1: "F"})
 
+        def qf(x, y):
+            qml.Displacement(0.5, 0, wires=[0])
+            qml.Squeezing(x, y, wires=[0])  # both parameters share a gate succeeded by an order-2 EV
+            return qml.expval(qml.NumberOperator(0))
+
+        check_methods(qf, {0: "A", 1: "A"})
+
     def test_qnode_gradient_multiple_gate_parameters(self, tol):
         """Tests that gates with multiple free parameters yield correct gradients."""
         par = [0.5, 0.3, -0.7]
@@ -1217,6 +1255,50 @@ class TestQNodeGradients:
         assert np.allclose(gradF, expected, atol=tol, rtol=0)
         assert np.allclose(gradA, expected, atol=tol, rtol=0)
 
+    def test_jacobian_single_device_session(self, tol):
+        """Tests that the shifted circuits of the Jacobian are executed
+        within a single device session"""
+        dev = qml.device("default.qubit", wires=1)
+
+        def circuit(x, y):
+            qml.RX(x, wires=0)
+            qml.RY(y, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        q = qml.QNode(circuit, dev)
+
+        with patch.object(dev, "execution_context", wraps=dev.execution_context) as context:
+            grad = q.jacobian([0.1, 0.2], method="A")
+
+        # four shifted circuits, one execution context
+        assert context.call_count == 1
+
+        expected = [-np.sin(0.1) * np.cos(0.2), -np.cos(0.1) * np.sin(0.2)]
+        assert np.allclose(grad, [expected], atol=tol, rtol=0)
+
+    def test_jacobian_outside_light_cone(self, tol):
+        """Tests that gates which cannot affect the measured observables
+        are not shifted by the analytic method"""
+        dev = qml.device("default.qubit", wires=3)
+
+        def circuit(x, y, z):
+            qml.RX(x, wires=0)
+            qml.RX(y, wires=1)
+            qml.CNOT(wires=[1, 0])
+            qml.RX(z, wires=2)
+            return qml.expval(qml.PauliZ(0))
+
+        q = qml.QNode(circuit, dev)
+
+        with patch.object(q, "evaluate", wraps=q.evaluate) as evaluate:
+            grad = q.jacobian([0.1, 0.2, 0.3], method="A")
+            # only x and y are shifted
+            assert evaluate.call_count == 4
+
+        expected = [-np.sin(0.1) * np.cos(0.2), -np.cos(0.1) * np.sin(0.2), 0]
+        assert np.allclose(grad, [expected], atol=tol, rtol=0)
+        assert np.allclose(grad, q.jacobian([0.1, 0.2, 0.3], method="F"), atol=tol, rtol=0)
+
 
 class TestQNodeVariance:
     """Qnode variance tests."""
@@ -1242,6 +1324,88 @@ class TestQNodeVariance:
         assert np.allclose(gradF, expected, atol=tol, rtol=0)
         assert np.allclose(gradA, expected, atol=tol, rtol=0)
 
+    def test_variance_jacobian_multiple_parameters(self, tol):
+        """Tests the analytic variance gradient with respect to several
+        parameters, which share the expectation values of the circuit"""
+        dev = qml.device("default.qubit", wires=1)
+
+        def circuit(a, b):
+            qml.RX(a, wires=0)
+            qml.RY(b, wires=0)
+            return qml.var(qml.PauliZ(0))
+
+        circuit = qml.QNode(circuit, dev)
+
+        a, b = 0.54, -0.12
+
+        with patch.object(circuit, "evaluate", wraps=circuit.evaluate) as evaluate:
+            gradA = circuit.jacobian([a, b], method="A")
+            # one unshifted and four shifted evaluations
+            assert evaluate.call_count == 5
+
+        expected = [
+            2 * np.cos(a) * np.sin(a) * np.cos(b) ** 2,
+            2 * np.cos(a) ** 2 * np.cos(b) * np.sin(b),
+        ]
+        assert np.allclose(gradA, [expected], atol=tol, rtol=0)
+
+    def test_variance_jacobian_restores_observables(self, tol):
+        """Tests that the analytic variance gradient restores the
+        measured observables of the circuit"""
+        dev = qml.device("default.qubit", wires=1)
+
+        A = np.array([[4, -1 + 6j], [-1 - 6j, 2]])
+
+        def circuit(a):
+            qml.RX(a, wires=0)
+            return qml.var(qml.Hermitian(A, 0))
+
+        circuit = qml.QNode(circuit, dev, cache=True)
+
+        a = 0.54
+        circuit(a)
+        ev = circuit.ev[0]
+        circuit.jacobian([a], method="A")
+
+        # the circuit still measures the original variance
+        assert circuit.ev[0] is ev
+        assert ev.return_type is qml.operation.Variance
+
+        expected = (39 / 2) - 6 * np.sin(2 * a) + (35 / 2) * np.cos(2 * a)
+        assert np.allclose(circuit(a), expected, atol=tol, rtol=0)
+
+    def test_multiple_non_involutory_variances(self, tol):
+        """Tests the analytic variance gradient of several non-involutory
+        Hermitian observables, alongside an involutory one"""
+        dev = qml.device("default.qubit", wires=3)
+
+        A = np.array([[4, -1 + 6j], [-1 - 6j, 2]])
+
+        def circuit(a, b):
+            qml.RX(a, wires=0)
+            qml.RX(b, wires=1)
+            qml.RY(a, wires=2)
+            return qml.var(qml.Hermitian(A, 0)), qml.var(qml.Hermitian(A, 1)), qml.var(qml.PauliZ(2))
+
+        circuit = qml.QNode(circuit, dev)
+
+        a, b = 0.54, -0.12
+
+        with patch.object(circuit, "evaluate", wraps=circuit.evaluate) as evaluate:
+            gradA = circuit.jacobian([a, b], method="A")
+            # one unshifted evaluation, and the shifted <A^2> and <A> evaluations
+            # for each parameter occurrence (a appears twice, b once)
+            assert evaluate.call_count == 1 + 2 * (4 + 2)
+
+        gradF = circuit.jacobian([a, b], method="F")
+        assert np.allclose(gradA, gradF, atol=tol, rtol=0)
+
+        def dvar(x):
+            return -12 * np.cos(2 * x) - 35 * np.sin(2 * x)
+
+        expected = [[dvar(a), 0], [0, dvar(b)], [np.sin(2 * a), 0]]
+        assert np.allclose(gradA, expected, atol=tol, rtol=0)
+
     def test_non_involutory_variance(self, tol):
         """Tests a qubit Hermitian observable that is not involutory"""
         dev = qml.device("default.qubit", wires=1)
@@ -1452,3 +1616,100 @@ class TestQNodeCacheing:
         circuit(0, c=1)
         # check structure
         assert len(circuit.queue) == 1
+
+    def test_caching_different_argument_structures(self, tol):
+        """Test that in caching mode, a circuit is constructed once for each
+        argument structure, and reused on subsequent evaluations"""
+        dev = qml.device("default.qubit", wires=2)
+
+        calls = []
+
+        def circuit(x):
+            calls.append(len(x))
+            for i, p in enumerate(x):
+                qml.RX(p, wires=i)
+            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))
+
+        circuit = qml.QNode(circuit, dev, cache=True)
+
+        res = circuit([0.1])
+        assert np.allclose(res, [np.cos(0.1), 1], atol=tol, rtol=0)
+        assert len(circuit.queue) == 1
+
+        res = circuit([0.2, 0.3])
+        assert np.allclose(res, [np.cos(0.2), np.cos(0.3)], atol=tol, rtol=0)
+        assert len(circuit.queue) == 2
+
+        res = circuit([0.4])
+        assert np.allclose(res, [np.cos(0.4), 1], atol=tol, rtol=0)
+        assert len(circuit.queue) == 1
+
+        grad = circuit.jacobian([[0.2, 0.3]])
+        assert np.allclose(grad, np.diag([-np.sin(0.2), -np.sin(0.3)]), atol=tol, rtol=0)
+
+        # the quantum function is only called once per argument structure
+        assert calls == [1, 2]
+
+    def test_caching_wires_from_keyword_arguments(self):
+        """Test that in caching mode, wires given by keyword arguments
+        are validated on every evaluation"""
+        dev = qml.device("default.qubit", wires=2)
+
+        def circuit(x, w=None):
+            qml.RX(x, wires=w)
+            return qml.expval(qml.PauliZ(0))
+
+        circuit = qml.QNode(circuit, dev, cache=True)
+        circuit(0.1, w=1)
+
+        with pytest.raises(QuantumFunctionError, match="applied to invalid wire"):
+            circuit(0.1, w=2)
+
+    def test_result_caching(self, tol):
+        """Test that in caching mode, results are reused for repeated argument
+        values if a result cache size is given"""
+        dev = qml.device("default.qubit", wires=1)
+
+        def circuit(x, c=None):
+            qml.RX(x, wires=0)
+            qml.RY(c, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        circuit = qml.QNode(circuit, dev, cache=True, result_cache_size=2)
+
+        with patch.object(dev, "execute", wraps=dev.execute) as execute:
+            res = circuit(0.1, c=0.2)
+            assert np.allclose(res, np.cos(0.1) * np.cos(0.2), atol=tol, rtol=0)
+            assert np.allclose(circuit(0.1, c=0.2), res, atol=tol, rtol=0)
+            assert execute.call_count == 1
+
+            # different argument values are evaluated on the device
+            res = circuit(0.1, c=0.3)
+            assert np.allclose(res, np.cos(0.1) * np.cos(0.3), atol=tol, rtol=0)
+            assert execute.call_count == 2
+
+            # the Jacobian is not computed from cached results
+            grad = circuit.jacobian([0.1], c=0.3)
+            assert np.allclose(grad, -np.sin(0.1) * np.cos(0.3), atol=tol, rtol=0)
+
+        # only the most recent results are stored
+        assert len(circuit._result_cache) == 2
+
+    def test_no_caching_jacobian_constructs_once(self, tol):
+        """Test that with caching turned off, the circuit evaluations
+        within the Jacobian computation do not reconstruct the circuit"""
+        dev = qml.device("default.qubit", wires=1)
+
+        def circuit(x, y):
+            qml.RX(x, wires=0)
+            qml.RY(y, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        circuit = qml.QNode(circuit, dev, cache=False)
+
+        with patch.object(circuit, "construct", wraps=circuit.construct) as construct:
+            grad = circuit.jacobian([0.1, 0.2], method="F", order=2)
+            assert construct.call_count == 1
+
+        expected = [-np.sin(0.1) * np.cos(0.2), -np.cos(0.1) * np.sin(0.2)]
+        assert np.allclose(grad, [expected], atol=1e-6, rtol=0)
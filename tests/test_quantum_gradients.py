@@ -16,6 +16,7 @@ Unit tests for the computing gradients of quantum functions.
 """
 
 import unittest
+from unittest.mock import patch
 import logging as log
 log.getLogger('defaults')
 
@@ -331,6 +332,26 @@ class CVGradientTest(BaseTest):
                 self.assertAllAlmostEqual(grad_A2, grad_F, delta=self.tol)
 
 
+    def test_force_order2(self):
+        "Tests that force_order2 is passed on to the analytic gradient method."
+        self.logTestName()
+
+        def circuit(x):
+            qml.Displacement(x, 0, wires=0)
+            return qml.expval(qml.X(0))
+
+        q = qml.QNode(circuit, self.gaussian_dev)
+
+        with patch.object(qml.QNode, 'evaluate_obs', autospec=True, side_effect=qml.QNode.evaluate_obs) as evaluate_obs:
+            grad_A = q.jacobian(0.5, method='A')
+            self.assertEqual(evaluate_obs.call_count, 0)
+
+            grad_A2 = q.jacobian(0.5, method='A', force_order2=True)
+            self.assertEqual(evaluate_obs.call_count, 1)
+
+        self.assertAllAlmostEqual(grad_A, grad_A2, delta=self.tol)
+
+
 class QubitGradientTest(BaseTest):
     """Tests of the automatic gradient method for qubit gates.
     """
@@ -19,261 +19,250 @@ import pytest
 
 import numpy as np
 
-try:
-    import tensorflow as tf
-    import tensorflow.contrib.eager as tfe
-    tf.enable_eager_execution()
-except ImportError as e:
-    pass
-
 import pennylane as qml
 
 from pennylane.qnode import _flatten, unflatten, QNode, QuantumFunctionError
-from pennylane.plugins.default_qubit import CNOT, Rotx, Roty, Rotz, I, Y, Z
 from pennylane._device import DeviceError
 
 
-def expZ(state):
-    return np.abs(state[0]) ** 2 - np.abs(state[1]) ** 2
+# all the tests require TensorFlow, whose deprecation warnings are not relevant here
+pytestmark = [
+    pytest.mark.filterwarnings("ignore::DeprecationWarning"),
+    pytest.mark.filterwarnings("ignore::FutureWarning"),
+    pytest.mark.usefixtures("tf"),
+]
+
 
-@pytest.fixture()
-def skip_if_no_tf_support(tf_support):
+@pytest.fixture(scope="session")
+def tf(tf_support):
+    """TensorFlow in eager mode, imported once per test session.
+    Skips the test if TensorFlow is not available."""
     if not tf_support:
-        pytest.skip("Skipped, no tfe support")   
+        pytest.skip("Skipped, no tfe support")
 
+    # the tf_support fixture has already enabled eager execution
+    tensorflow = pytest.importorskip("tensorflow")
+    tensorflow.logging.set_verbosity(tensorflow.logging.ERROR)
+    return tensorflow
 
-@pytest.mark.usefixtures("skip_if_no_tf_support")
-class TestTFEQNodeExceptions():
-    """TFEQNode basic tests."""
 
-    def test_qnode_fails_on_wrong_return_type(self, qubit_device_2_wires):
-        """The qfunc must return only Expectations"""
-        @qml.qnode(qubit_device_2_wires, interface='tfe')
-        def qf(x):
-            qml.RX(x, wires=[0])
-            return qml.expval(qml.PauliZ(0)), 0.3
+@pytest.fixture(scope="session")
+def tfe(tf):  # pylint: disable=redefined-outer-name,unused-argument
+    """The TensorFlow eager module, imported once per test session."""
+    return pytest.importorskip("tensorflow.contrib.eager")
 
-        with pytest.raises(QuantumFunctionError, match='must return either'):
-            qf(tfe.Variable(0.5))
 
-    def test_qnode_fails_on_expval_not_returned(self, qubit_device_2_wires):
-        """All expectation values in the qfunc must be returned"""
+def qf_wrong_return_type(x):
+    """The qfunc must return only Expectations"""
+    qml.RX(x, wires=[0])
+    return qml.expval(qml.PauliZ(0)), 0.3
 
-        @qml.qnode(qubit_device_2_wires, interface='tfe')
-        def qf(x):
-            qml.RX(x, wires=[0])
-            ex = qml.expval(qml.PauliZ(1))
-            return qml.expval(qml.PauliZ(0))
 
-        with pytest.raises(QuantumFunctionError, match='All measured observables'):
-            qf(tfe.Variable(0.5))
+def qf_expval_not_returned(x):
+    """All expectation values in the qfunc must be returned"""
+    qml.RX(x, wires=[0])
+    ex = qml.expval(qml.PauliZ(1))
+    return qml.expval(qml.PauliZ(0))
 
-    def test_qnode_fails_on_wrong_expval_order(self, qubit_device_2_wires):
-        """Expvals must be returned in the order they were created in"""
 
-        @qml.qnode(qubit_device_2_wires, interface='tfe')
-        def qf(x):
-            qml.RX(x, wires=[0])
-            ex = qml.expval(qml.PauliZ(1))
-            return qml.expval(qml.PauliZ(0)), ex
+def qf_wrong_expval_order(x):
+    """Expvals must be returned in the order they were created in"""
+    qml.RX(x, wires=[0])
+    ex = qml.expval(qml.PauliZ(1))
+    return qml.expval(qml.PauliZ(0)), ex
 
-        with pytest.raises(QuantumFunctionError, match='All measured observables'):
-            qf(tfe.Variable(0.5))
 
-    def test_qnode_fails_on_gates_after_measurements(self, qubit_device_2_wires):
-        """Gates have to precede measurements"""
+def qf_gates_after_measurements(x):
+    """Gates have to precede measurements"""
+    qml.RX(x, wires=[0])
+    ev = qml.expval(qml.PauliZ(1))
+    qml.RY(0.5, wires=[0])
+    return ev
 
-        @qml.qnode(qubit_device_2_wires, interface='tfe')
-        def qf(x):
-            qml.RX(x, wires=[0])
-            ev = qml.expval(qml.PauliZ(1))
-            qml.RY(0.5, wires=[0])
-            return ev
 
-        with pytest.raises(QuantumFunctionError, match='gates must precede'):
-            qf(tfe.Variable(0.5))
+def qf_multiple_measurements_of_same_wire(x):
+    """A wire can only be measured once"""
+    qml.RX(x, wires=[0])
+    qml.CNOT(wires=[0, 1])
+    return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1)), qml.expval(qml.PauliX(0))
 
-    def test_qnode_fails_on_multiple_measurements_of_same_wire(self, qubit_device_2_wires):
-        """A wire can only be measured once"""
-        
-        @qml.qnode(qubit_device_2_wires, interface='tfe')
-        def qf(x):
-            qml.RX(x, wires=[0])
-            qml.CNOT(wires=[0, 1])
-            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1)), qml.expval(qml.PauliX(0))
 
-        with pytest.raises(QuantumFunctionError, match='can only be measured once'):
-            qf(tfe.Variable(0.5))
+def qf_too_many_wires(x):
+    """The device must have sufficient wires for the qfunc"""
+    qml.RX(x, wires=[0])
+    qml.CNOT(wires=[0, 2])
+    return qml.expval(qml.PauliZ(0))
 
-    def test_qnode_fails_on_qfunc_with_too_many_wires(self, qubit_device_2_wires):
-        """The device must have sufficient wires for the qfunc"""
 
-        @qml.qnode(qubit_device_2_wires, interface='tfe')
-        def qf(x):
-            qml.RX(x, wires=[0])
-            qml.CNOT(wires=[0, 2])
-            return qml.expval(qml.PauliZ(0))
+def qf_combination_of_cv_and_qbit_ops(x):
+    """CV and discrete operations must not be mixed"""
+    qml.RX(x, wires=[0])
+    qml.Displacement(0.5, 0, wires=[0])
+    return qml.expval(qml.PauliZ(0))
 
-        with pytest.raises(QuantumFunctionError, match='applied to invalid wire'):
-            qf(tfe.Variable(0.5))
 
-    def test_qnode_fails_on_combination_of_cv_and_qbit_ops(self, qubit_device_1_wire):
-        """CV and discrete operations must not be mixed"""
-        
-        @qml.qnode(qubit_device_1_wire, interface='tfe')
-        def qf(x):
-            qml.RX(x, wires=[0])
-            qml.Displacement(0.5, 0, wires=[0])
-            return qml.expval(qml.PauliZ(0))
+def qf_cv_ops(x):
+    """A qubit device cannot execute CV operations"""
+    qml.Displacement(0.5, 0, wires=[0])
+    return qml.expval(qml.X(0))
 
-        with pytest.raises(QuantumFunctionError, match='Continuous and discrete'):
-            qf(tfe.Variable(0.5))
 
-    def test_qnode_fails_for_cv_ops_on_qubit_device(self, qubit_device_1_wire):
-        """A qubit device cannot execute CV operations"""
+def qf_cv_observables(x):
+    """A qubit device cannot measure CV observables"""
+    return qml.expval(qml.X(0))
 
-        @qml.qnode(qubit_device_1_wire, interface='tfe')
-        def qf(x):
-            qml.Displacement(0.5, 0, wires=[0])
-            return qml.expval(qml.X(0))
 
-        with pytest.raises(DeviceError, match='Gate [a-zA-Z]+ not supported on device'):
-            qf(tfe.Variable(0.5))
+# invalid quantum functions, the shared device fixture they are run on, and the expected error
+QNODE_EXCEPTION_CASES = [
+    pytest.param(qf_wrong_return_type, "shared_dev2", QuantumFunctionError, 'must return either',
+                 id="wrong_return_type"),
+    pytest.param(qf_expval_not_returned, "shared_dev2", QuantumFunctionError, 'All measured observables',
+                 id="expval_not_returned"),
+    pytest.param(qf_wrong_expval_order, "shared_dev2", QuantumFunctionError, 'All measured observables',
+                 id="wrong_expval_order"),
+    pytest.param(qf_gates_after_measurements, "shared_dev2", QuantumFunctionError, 'gates must precede',
+                 id="gates_after_measurements"),
+    pytest.param(qf_multiple_measurements_of_same_wire, "shared_dev2", QuantumFunctionError,
+                 'can only be measured once', id="multiple_measurements_of_same_wire"),
+    pytest.param(qf_too_many_wires, "shared_dev2", QuantumFunctionError, 'applied to invalid wire',
+                 id="qfunc_with_too_many_wires"),
+    pytest.param(qf_combination_of_cv_and_qbit_ops, "shared_dev1", QuantumFunctionError,
+                 'Continuous and discrete', id="combination_of_cv_and_qbit_ops"),
+    pytest.param(qf_cv_ops, "shared_dev1", DeviceError, 'Gate [a-zA-Z]+ not supported on device',
+                 id="cv_ops_on_qubit_device"),
+    pytest.param(qf_cv_observables, "shared_dev1", DeviceError, 'Observable [a-zA-Z]+ not supported on device',
+                 id="cv_observables_on_qubit_device"),
+]
 
-    def test_qnode_fails_for_cv_observables_on_qubit_device(self, qubit_device_1_wire):
-        """A qubit device cannot measure CV observables"""
 
-        @qml.qnode(qubit_device_1_wire, interface='tfe')
-        def qf(x):
-            return qml.expval(qml.X(0))
+# The QNodes of the exception tests fail before any circuit is executed,
+# so the devices can be shared between them.
+
+@pytest.fixture(scope="module")
+def shared_dev1():
+    """Single-wire qubit device shared by the exception tests"""
+    return qml.device('default.qubit', wires=1)
+
 
-        with pytest.raises(DeviceError, match='Observable [a-zA-Z]+ not supported on device'):
+@pytest.fixture(scope="module")
+def shared_dev2():
+    """Two-wire qubit device shared by the exception tests"""
+    return qml.device('default.qubit', wires=2)
+
+
+class TestTFEQNodeExceptions():
+    """TFEQNode basic tests."""
+
+    @pytest.mark.parametrize("qfunc, device_fixture, error, match", QNODE_EXCEPTION_CASES)
+    def test_qnode_fails(self, tfe, qfunc, device_fixture, error, match, request):
+        """Tests that invalid quantum functions raise the expected error"""
+        qf = qml.qnode(request.getfixturevalue(device_fixture), interface='tfe')(qfunc)
+
+        with pytest.raises(error, match=match):
             qf(tfe.Variable(0.5))
 
 
-@pytest.mark.usefixtures("skip_if_no_tf_support")
-class TestTFEQNodeParameterHandling:
-    """Test that the TFEQNode properly handles the parameters of qfuncs"""
+# parameter values of test_qnode_fanout
+FANOUT_THETAS = np.linspace(-2*np.pi, 2*np.pi, 7)
 
-    def test_qnode_fanout(self, qubit_device_1_wire, tol):
-        """Tests that qnodes can compute the correct function when the same parameter is used in multiple gates."""
+# initial state of the circuits in test_array_parameters_evaluate
+INPUT_STATE = np.array([1, 0, 1, 1])/np.sqrt(3)
 
-        @qml.qnode(qubit_device_1_wire, interface='tfe')
-        def circuit(reused_param, other_param):
-            qml.RX(reused_param, wires=[0])
-            qml.RZ(other_param, wires=[0])
-            qml.RX(reused_param, wires=[0])
-            return qml.expval(qml.PauliZ(0))
+# expected cost of the circuits returned by _array_parameters_circuit,
+# and its gradient with respect to the first and last arguments
+ARRAY_PARAMETERS_GRAD_TARGET = np.array([1., -0.4], dtype=np.float32)
+ARRAY_PARAMETERS_COST_TARGET = 1.03257
 
-        thetas = tf.linspace(-2*np.pi, 2*np.pi, 7)
 
-        for reused_param in thetas:
-            for theta in thetas:
-                other_param = theta ** 2 / 11
-                y_eval = circuit(reused_param, other_param)
-                Rx = Rotx(reused_param.numpy())
-                Rz = Rotz(other_param.numpy())
-                zero_state = np.array([1.,0.])
-                final_state = (Rx @ Rz @ Rx @ zero_state)
-                y_true = expZ(final_state)
+def _array_parameters_circuit(device, return_style):
+    """Circuit taking an array argument, used to test the interoperability
+    of the different QNode return types with TensorFlow.
 
-                assert np.allclose(y_eval, y_true, atol=tol, rtol=0)
+    Args:
+        device (Device): device to run the circuit on, with two wires for the 2-vector return style
+        return_style (str): one of ``"scalar"``, ``"1-vector"`` or ``"2-vector"``
 
-    def test_qnode_array_parameters_scalar_return(self, qubit_device_1_wire, tol):
-        """Test that QNode can take arrays as input arguments, and that they interact properly with TensorFlow.
-           Test case for a circuit that returns a scalar."""
+    Returns:
+        QNode: QNode with the TensorFlow interface
+    """
+    @qml.qnode(device, interface='tfe')
+    def circuit(dummy1, array, dummy2):
+        qml.RY(0.5 * array[0,1], wires=0)
+        qml.RY(-0.5 * array[1,1], wires=0)
 
-        # The objective of this test is not to check if the results are correctly calculated, 
-        # but to check that the interoperability of the different return types works.
-        @qml.qnode(qubit_device_1_wire, interface='tfe')
-        def circuit(dummy1, array, dummy2):
-            qml.RY(0.5 * array[0,1], wires=0)
-            qml.RY(-0.5 * array[1,1], wires=0)
+        if return_style == "scalar":
             return qml.expval(qml.PauliX(0))  # returns a scalar
 
-        grad_target = (np.array(1.), np.array([[0.5,  0.43879, 0], [0, -0.43879, 0]]), np.array(-0.4))
-        cost_target = 1.03257
+        if return_style == "1-vector":
+            return qml.expval(qml.PauliX(0)),  # note the comma, returns a 1-vector
 
-        args = (tfe.Variable(0.46), tfe.Variable([[2., 3., 0.3], [7., 4., 2.1]]), tfe.Variable(-0.13))
+        qml.RY(array[1,0], wires=1)
+        return qml.expval(qml.PauliX(0)), qml.expval(qml.PauliX(1))  # returns a 2-vector
 
-        def cost(x, array, y):
-            c = tf.cast(circuit(tf.constant(0.111), array, tf.constant(4.5)), tf.float32)
-            
-            return c +0.5*array[0,0] +x -0.4*y
+    return circuit
 
-        with tf.GradientTape() as tape:
-            cost_res = cost(*args)
-            grad_res = np.array([i.numpy() for i in tape.gradient(cost_res, [args[0], args[2]])])
 
-        assert np.allclose(cost_res.numpy(), cost_target, atol=tol, rtol=0)
-        assert np.allclose(grad_res, np.fromiter(grad_target[::2], dtype=np.float32), atol=tol, rtol=0)
+class TestTFEQNodeParameterHandling:
+    """Test that the TFEQNode properly handles the parameters of qfuncs"""
 
-    def test_qnode_array_parameters_1_vector_return(self, qubit_device_1_wire, tol):
-        """Test that QNode can take arrays as input arguments, and that they interact properly with TensorFlow
-           Test case for a circuit that returns a 1-vector."""
+    def test_qnode_fanout(self, tf, qubit_device_1_wire, tol):
+        """Tests that qnodes can compute the correct function when the same parameter is used in multiple gates."""
 
-        # The objective of this test is not to check if the results are correctly calculated, 
-        # but to check that the interoperability of the different return types works.
         @qml.qnode(qubit_device_1_wire, interface='tfe')
-        def circuit(dummy1, array, dummy2):
-            qml.RY(0.5 * array[0,1], wires=0)
-            qml.RY(-0.5 * array[1,1], wires=0)
-            return qml.expval(qml.PauliX(0)),  # note the comma, returns a 1-vector
-
-        grad_target = (np.array(1.), np.array([[0.5,  0.43879, 0], [0, -0.43879, 0]]), np.array(-0.4))
-        cost_target = 1.03257
+        def circuit(reused_param, other_param):
+            qml.RX(reused_param, wires=[0])
+            qml.RZ(other_param, wires=[0])
+            qml.RX(reused_param, wires=[0])
+            return qml.expval(qml.PauliZ(0))
 
-        args = (tfe.Variable(0.46), tfe.Variable([[2., 3., 0.3], [7., 4., 2.1]]), tfe.Variable(-0.13))
+        thetas = tf.constant(FANOUT_THETAS)
 
-        def cost(x, array, y):
-            c = tf.cast(circuit(tf.constant(0.111), array, tf.constant(4.5)), tf.float32)
-            c = c[0]  # get a scalar
-            return c +0.5*array[0,0] +x -0.4*y
+        # expected values for the whole parameter grid, <Z> = cos(r)^2 - cos(o) sin(r)^2
+        r = FANOUT_THETAS[:, None]
+        o = r.T ** 2 / 11
+        y_true = np.cos(r) ** 2 - np.cos(o) * np.sin(r) ** 2
 
-        with tf.GradientTape() as tape:
-            cost_res = cost(*args)
-            grad_res = np.array([i.numpy() for i in tape.gradient(cost_res, [args[0], args[2]])])
+        # the QNode converts its inputs to NumPy, so it is evaluated eagerly for each pair
+        y_eval = np.array([[circuit(reused_param, theta ** 2 / 11).numpy() for theta in thetas]
+                           for reused_param in thetas])
 
-        assert np.allclose(cost_res.numpy(), cost_target, atol=tol, rtol=0)
-        assert np.allclose(grad_res, np.fromiter(grad_target[::2], dtype=np.float32), atol=tol, rtol=0)
+        np.testing.assert_allclose(y_eval, y_true, atol=tol, rtol=0)
 
-    def test_qnode_array_parameters_2_vector_return(self, qubit_device_2_wires, tol):
-        """Test that QNode can take arrays as input arguments, and that they interact properly with TensorFlow
-           Test case for a circuit that returns a 2-vector."""
+    @pytest.mark.parametrize("return_style, device_fixture", [
+        ("scalar", "qubit_device_1_wire"),
+        ("1-vector", "qubit_device_1_wire"),
+        ("2-vector", "qubit_device_2_wires"),
+    ])
+    def test_qnode_array_parameters(self, tf, tfe, return_style, device_fixture, request, tol):
+        """Test that QNode can take arrays as input arguments, and that they interact properly with TensorFlow.
+           Test cases for circuits that return a scalar, a 1-vector and a 2-vector."""
 
         # The objective of this test is not to check if the results are correctly calculated, 
         # but to check that the interoperability of the different return types works.
-        @qml.qnode(qubit_device_2_wires, interface='tfe')
-        def circuit(dummy1, array, dummy2):
-            qml.RY(0.5 * array[0,1], wires=0)
-            qml.RY(-0.5 * array[1,1], wires=0)
-            qml.RY(array[1,0], wires=1)
-            return qml.expval(qml.PauliX(0)), qml.expval(qml.PauliX(1))  # returns a 2-vector
-
-        grad_target = (np.array(1.), np.array([[0.5,  0.43879, 0], [0, -0.43879, 0]]), np.array(-0.4))
-        cost_target = 1.03257
+        circuit = _array_parameters_circuit(request.getfixturevalue(device_fixture), return_style)
 
         args = (tfe.Variable(0.46), tfe.Variable([[2., 3., 0.3], [7., 4., 2.1]]), tfe.Variable(-0.13))
+        dummy1, dummy2 = tf.constant(0.111), tf.constant(4.5)
 
         def cost(x, array, y):
-            c = tf.cast(circuit(tf.constant(0.111), array, tf.constant(4.5)), tf.float32)
-            c = c[0]  # get a scalar
+            c = tf.cast(circuit(dummy1, array, dummy2), tf.float32)
+            if return_style != "scalar":
+                c = c[0]  # get a scalar
             return c +0.5*array[0,0] +x -0.4*y
 
         with tf.GradientTape() as tape:
             cost_res = cost(*args)
             grad_res = np.array([i.numpy() for i in tape.gradient(cost_res, [args[0], args[2]])])
 
-        assert np.allclose(cost_res.numpy(), cost_target, atol=tol, rtol=0)
-        assert np.allclose(grad_res, np.fromiter(grad_target[::2], dtype=np.float32), atol=tol, rtol=0)
+        np.testing.assert_allclose(cost_res.numpy(), ARRAY_PARAMETERS_COST_TARGET, atol=tol, rtol=0)
+        np.testing.assert_allclose(grad_res, ARRAY_PARAMETERS_GRAD_TARGET, atol=tol, rtol=0)
 
-
-    def test_array_parameters_evaluate(self, qubit_device_2_wires, tol):
+    def test_array_parameters_evaluate(self, tf, tfe, qubit_device_2_wires, tol):
         """Test that array parameters gives same result as positional arguments."""
         a, b, c = tf.constant(0.5), tf.constant(0.54), tf.constant(0.3)
 
         def ansatz(x, y, z):
-            qml.QubitStateVector(np.array([1, 0, 1, 1])/np.sqrt(3), wires=[0, 1])
+            qml.QubitStateVector(INPUT_STATE, wires=[0, 1])
             qml.Rot(x, y, z, wires=0)
             qml.CNOT(wires=[0, 1])
             return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliY(1))
@@ -290,14 +279,19 @@ class TestTFEQNodeParameterHandling:
         def circuit3(array):
             return ansatz(*array)
 
+        # pack the array arguments from the same tensors
+        bc = tfe.Variable(tf.stack([b, c]))
+        abc = tfe.Variable(tf.stack([a, b, c]))
+
         positional_res = circuit1(a, b, c)
-        array_res1 = circuit2(a, tfe.Variable([b, c]))
-        array_res2 = circuit3(tfe.Variable([a, b, c]))
+        array_res1 = circuit2(a, bc)
+        array_res2 = circuit3(abc)
 
-        assert np.allclose(positional_res.numpy(), array_res1.numpy(), atol=tol, rtol=0)
-        assert np.allclose(positional_res.numpy(), array_res2.numpy(), atol=tol, rtol=0)
+        positional_res = positional_res.numpy()
+        np.testing.assert_allclose(positional_res, array_res1.numpy(), atol=tol, rtol=0)
+        np.testing.assert_allclose(positional_res, array_res2.numpy(), atol=tol, rtol=0)
 
-    def test_multiple_expectation_different_wires(self, qubit_device_2_wires, tol):
+    def test_multiple_expectation_different_wires(self, tfe, qubit_device_2_wires, tol):
         """Tests that qnodes return multiple expectation values."""
         a, b, c = tfe.Variable(0.5), tfe.Variable(0.54), tfe.Variable(0.3)
 
@@ -312,16 +306,16 @@ class TestTFEQNodeParameterHandling:
 
         res = circuit(a, b, c)
 
-        out_state = np.kron(Rotx(c.numpy()), I) @ np.kron(Roty(b.numpy()), I) @ CNOT \
-            @ np.kron(Rotz(b.numpy()), I) @ np.kron(Rotx(a.numpy()), I) @ np.array([1, 0, 0, 0])
-
-        ex0 = np.vdot(out_state, np.kron(Y, I) @ out_state)
-        ex1 = np.vdot(out_state, np.kron(I, Z) @ out_state)
+        # After the CNOT, the reduced state of wire 0 is diagonal with
+        # <Z0> = cos(a), and the following rotations only act on wire 0.
+        a_np, b_np, c_np = a.numpy(), b.numpy(), c.numpy()
+        ex0 = -np.cos(a_np) * np.cos(b_np) * np.sin(c_np)
+        ex1 = np.cos(a_np)
         ex = np.array([ex0, ex1])
 
-        assert np.allclose(ex, res.numpy(), atol=tol, rtol=0)
+        np.testing.assert_allclose(ex, res.numpy(), atol=tol, rtol=0)
 
-    def test_multiple_keywordargs_used(self, qubit_device_2_wires, tol):
+    def test_multiple_keywordargs_used(self, tf, qubit_device_2_wires, tol):
         """Tests that qnodes use multiple keyword arguments."""
 
         @qml.qnode(qubit_device_2_wires, interface='tfe')
@@ -332,9 +326,9 @@ class TestTFEQNodeParameterHandling:
 
         c = circuit(tf.constant(1.), x=np.pi, y=np.pi)
 
-        assert np.allclose(c.numpy(), [-1., -1.], atol=tol, rtol=0)
+        np.testing.assert_allclose(c.numpy(), [-1., -1.], atol=tol, rtol=0)
 
-    def test_multidimensional_keywordargs_used(self, qubit_device_2_wires, tol):
+    def test_multidimensional_keywordargs_used(self, tf, qubit_device_2_wires, tol):
         """Tests that qnodes use multi-dimensional keyword arguments."""
         def circuit(w, x=None):
             qml.RX(x[0], wires=[0])
@@ -344,9 +338,9 @@ class TestTFEQNodeParameterHandling:
         circuit = qml.QNode(circuit, qubit_device_2_wires).to_tfe()
 
         c = circuit(tf.constant(1.), x=[np.pi, np.pi])
-        assert np.allclose(c.numpy(), [-1., -1.], atol=tol, rtol=0)
+        np.testing.assert_allclose(c.numpy(), [-1., -1.], atol=tol, rtol=0)
 
-    def test_keywordargs_for_wires(self, qubit_device_2_wires, tol):
+    def test_keywordargs_for_wires(self, tf, qubit_device_2_wires, tol):
         """Tests that wires can be passed as keyword arguments."""
         default_q = 0
 
@@ -357,12 +351,12 @@ class TestTFEQNodeParameterHandling:
         circuit = qml.QNode(circuit, qubit_device_2_wires).to_tfe()
 
         c = circuit(tf.constant(np.pi), q=1)
-        assert np.allclose(c, 1., atol=tol, rtol=0)
+        np.testing.assert_allclose(c.numpy(), 1., atol=tol, rtol=0)
 
         c = circuit(tf.constant(np.pi))
-        assert np.allclose(c.numpy(), -1., atol=tol, rtol=0)
+        np.testing.assert_allclose(c.numpy(), -1., atol=tol, rtol=0)
 
-    def test_keywordargs_used(self, qubit_device_1_wire, tol):
+    def test_keywordargs_used(self, tf, qubit_device_1_wire, tol):
         """Tests that qnodes use keyword arguments."""
 
         def circuit(w, x=None):
@@ -372,9 +366,9 @@ class TestTFEQNodeParameterHandling:
         circuit = qml.QNode(circuit, qubit_device_1_wire).to_tfe()
 
         c = circuit(tf.constant(1.), x=np.pi)
-        assert np.allclose(c.numpy(), -1., atol=tol, rtol=0)
+        np.testing.assert_allclose(c.numpy(), -1., atol=tol, rtol=0)
 
-    def test_mixture_numpy_tensors(self, qubit_device_2_wires, tol):
+    def test_mixture_numpy_tensors(self, tf, qubit_device_2_wires, tol):
         """Tests that qnodes work with python types and tensors."""
 
         @qml.qnode(qubit_device_2_wires, interface='tfe')
@@ -384,9 +378,9 @@ class TestTFEQNodeParameterHandling:
             return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))
 
         c = circuit(tf.constant(1.), np.pi, np.pi).numpy()
-        assert np.allclose(c, [-1., -1.], atol=tol, rtol=0)
+        np.testing.assert_allclose(c, [-1., -1.], atol=tol, rtol=0)
 
-    def test_keywordarg_updated_in_multiple_calls(self, qubit_device_2_wires):
+    def test_keywordarg_updated_in_multiple_calls(self, tf, qubit_device_2_wires):
         """Tests that qnodes update keyword arguments in consecutive calls."""
 
         def circuit(w, x=None):
@@ -400,7 +394,7 @@ class TestTFEQNodeParameterHandling:
         c2 = circuit(tf.constant(0.1), x=np.pi)
         assert c1[1] != c2[1]
 
-    def test_keywordarg_passes_through_classicalnode(self, qubit_device_2_wires, tol):
+    def test_keywordarg_passes_through_classicalnode(self, tf, qubit_device_2_wires, tol):
         """Tests that qnodes' keyword arguments pass through classical nodes."""
 
         def circuit(w, x=None):
@@ -414,10 +408,12 @@ class TestTFEQNodeParameterHandling:
             return circuit(w, x=x)
 
         c = classnode(tf.constant(0.), x=np.pi)
-        assert np.allclose(c.numpy(), [1., -1.], atol=tol, rtol=0)
+        np.testing.assert_allclose(c.numpy(), [1., -1.], atol=tol, rtol=0)
 
-    def test_keywordarg_gradient(self, qubit_device_2_wires, tol):
-        """Tests that qnodes' keyword arguments work with gradients"""
+    @pytest.mark.parametrize("cache", [False, True])
+    def test_keywordarg_gradient(self, tf, tfe, qubit_device_2_wires, cache, tol):
+        """Tests that qnodes' keyword arguments work with gradients, both when the
+        circuit is constructed on every call and when it is cached"""
 
         def circuit(x, y, input_state=np.array([0, 0])):
             qml.BasisState(input_state, wires=[0, 1])
@@ -425,7 +421,7 @@ class TestTFEQNodeParameterHandling:
             qml.RY(y, wires=[0])
             return qml.expval(qml.PauliZ(0))
 
-        circuit = qml.QNode(circuit, qubit_device_2_wires).to_tfe()
+        circuit = qml.QNode(circuit, qubit_device_2_wires, cache=cache).to_tfe()
 
         x = 0.543
         y = 0.45632
@@ -439,86 +435,76 @@ class TestTFEQNodeParameterHandling:
             c = circuit(x_t, y_t, input_state=np.array([0, 0]))
             grads = np.array(tape.gradient(c, [x_t, y_t]))
 
-        assert np.allclose(grads, -expected_grad, atol=tol, rtol=0)
+        np.testing.assert_allclose(grads, -expected_grad, atol=tol, rtol=0)
 
         # test third basis state against analytic result
         with tf.GradientTape() as tape:
             c = circuit(x_t, y_t, input_state=np.array([1, 0]))
             grads = np.array(tape.gradient(c, [x_t, y_t]))
 
-        assert np.allclose(grads, expected_grad, atol=tol, rtol=0)
+        np.testing.assert_allclose(grads, expected_grad, atol=tol, rtol=0)
 
         # test first basis state via the default keyword argument against analytic result
         with tf.GradientTape() as tape:
             c = circuit(x_t, y_t)
             grads = np.array(tape.gradient(c, [x_t, y_t]))
 
-        assert np.allclose(grads, -expected_grad, atol=tol, rtol=0)
+        np.testing.assert_allclose(grads, -expected_grad, atol=tol, rtol=0)
 
 
-@pytest.mark.usefixtures("skip_if_no_tf_support")
-class TestIntegration():
-    """Integration tests to ensure the TensorFlow QNode agrees with the NumPy QNode"""
+# parameters of the circuit in TestIntegration
+INTEGRATION_PHI = [0.5, 0.1]
+INTEGRATION_THETA = [0.2]
 
-    def test_qnode_evaluation_agrees(self, qubit_device_2_wires, tol):
-        """Tests that simple example is consistent."""
 
-        @qml.qnode(qubit_device_2_wires, interface='autograd')
-        def circuit(phi, theta):
-            qml.RX(phi[0], wires=0)
-            qml.RY(phi[1], wires=1)
-            qml.CNOT(wires=[0, 1])
-            qml.PhaseShift(theta[0], wires=0)
-            return qml.expval(qml.PauliZ(0))
+def _integration_circuit(phi, theta):
+    """Quantum function of the integration tests"""
+    qml.RX(phi[0], wires=0)
+    qml.RY(phi[1], wires=1)
+    qml.CNOT(wires=[0, 1])
+    qml.PhaseShift(theta[0], wires=0)
+    return qml.expval(qml.PauliZ(0))
 
-        @qml.qnode(qubit_device_2_wires, interface='tfe')
-        def circuit_tfe(phi, theta):
-            qml.RX(phi[0], wires=0)
-            qml.RY(phi[1], wires=1)
-            qml.CNOT(wires=[0, 1])
-            qml.PhaseShift(theta[0], wires=0)
-            return qml.expval(qml.PauliZ(0))
 
-        phi = [0.5, 0.1]
-        theta = [0.2]
+@pytest.fixture(scope="module")
+def integration_reference():
+    """Value and gradient of the NumPy QNode of the integration test circuit,
+    which are shared by the integration tests"""
+    dev = qml.device('default.qubit', wires=2)
+    circuit_autograd = qml.qnode(dev, interface='autograd')(_integration_circuit)
 
-        phi_t = tfe.Variable(phi)
-        theta_t = tfe.Variable(theta)
+    autograd_eval = circuit_autograd(INTEGRATION_PHI, INTEGRATION_THETA)
 
-        autograd_eval = circuit(phi, theta)
-        tfe_eval = circuit_tfe(phi_t, theta_t)
-        assert np.allclose(autograd_eval, tfe_eval.numpy(), atol=tol, rtol=0)
+    dcircuit = qml.grad(circuit_autograd, [0, 1])
+    autograd_grad = dcircuit(INTEGRATION_PHI, INTEGRATION_THETA)
 
-    def test_qnode_gradient_agrees(self, qubit_device_2_wires, tol):
-        """Tests that simple gradient example is consistent."""
+    return autograd_eval, autograd_grad
 
-        @qml.qnode(qubit_device_2_wires, interface='autograd')
-        def circuit(phi, theta):
-            qml.RX(phi[0], wires=0)
-            qml.RY(phi[1], wires=1)
-            qml.CNOT(wires=[0, 1])
-            qml.PhaseShift(theta[0], wires=0)
-            return qml.expval(qml.PauliZ(0))
 
-        @qml.qnode(qubit_device_2_wires, interface='tfe')
-        def circuit_tfe(phi, theta):
-            qml.RX(phi[0], wires=0)
-            qml.RY(phi[1], wires=1)
-            qml.CNOT(wires=[0, 1])
-            qml.PhaseShift(theta[0], wires=0)
-            return qml.expval(qml.PauliZ(0))
+class TestIntegration():
+    """Integration tests to ensure the TensorFlow QNode agrees with the NumPy QNode"""
+
+    def test_qnode_evaluation_agrees(self, tfe, integration_reference, qubit_device_2_wires, tol):
+        """Tests that simple example is consistent."""
+        autograd_eval, _ = integration_reference
+        circuit_tfe = qml.qnode(qubit_device_2_wires, interface='tfe')(_integration_circuit)
 
-        phi = [0.5, 0.1]
-        theta = [0.2]
+        phi_t = tfe.Variable(INTEGRATION_PHI)
+        theta_t = tfe.Variable(INTEGRATION_THETA)
 
-        phi_t = tfe.Variable(phi)
-        theta_t = tfe.Variable(theta)
+        tfe_eval = circuit_tfe(phi_t, theta_t)
+        np.testing.assert_allclose(autograd_eval, tfe_eval.numpy(), atol=tol, rtol=0)
+
+    def test_qnode_gradient_agrees(self, tfe, integration_reference, qubit_device_2_wires, tol):
+        """Tests that simple gradient example is consistent."""
+        _, autograd_grad = integration_reference
+        circuit_tfe = qml.qnode(qubit_device_2_wires, interface='tfe')(_integration_circuit)
 
-        dcircuit = qml.grad(circuit, [0, 1])
-        autograd_grad = dcircuit(phi, theta)
+        phi_t = tfe.Variable(INTEGRATION_PHI)
+        theta_t = tfe.Variable(INTEGRATION_THETA)
 
         dcircuit = tfe.gradients_function(circuit_tfe)
         tfe_grad = dcircuit(phi_t, theta_t)
 
-        assert np.allclose(autograd_grad[0], tfe_grad[0], atol=tol, rtol=0)
-        assert np.allclose(autograd_grad[1], tfe_grad[1], atol=tol, rtol=0)
+        np.testing.assert_allclose(autograd_grad[0], tfe_grad[0], atol=tol, rtol=0)
+        np.testing.assert_allclose(autograd_grad[1], tfe_grad[1], atol=tol, rtol=0)